@@ -6,13 +6,134 @@ against policy rules before execution. This is the critical security gateway tha
 prevents unauthorized operations.
 """
 
-from typing import Dict, Any
+from dataclasses import replace
+from typing import Dict, Any, FrozenSet, Optional
 from models import Intent, PolicyDecision, ExecutionResult
 from policy import PolicyEngine
 from executor import Executor
 from logger import AuditLogger
 
 
+# Constraint checks. Each takes the (copied) intent parameters, the rule
+# constraints and their allowed-value sets, returns immediately if its
+# constraint key is absent, and raises ValueError on a violation. Without a
+# prebuilt set, membership is checked against the constraint value itself.
+# Size limits are attached to the parameters.
+
+def _check_format(parameters: Dict[str, Any], constraints: Dict[str, Any],
+                  allowed_values: Dict[str, FrozenSet[str]]) -> None:
+    """Check the requested report format against allowed_formats."""
+    allowed_formats = constraints.get("allowed_formats")
+    if allowed_formats is None:
+        return
+    report_format = parameters.get("format")
+    allowed = allowed_values.get("allowed_formats", allowed_formats)
+    if report_format is not None and report_format not in allowed:
+        raise ValueError(
+            f"Format '{report_format}' not allowed. "
+            f"Allowed formats: {', '.join(allowed_formats)}"
+        )
+
+
+def _check_size(parameters: Dict[str, Any], constraints: Dict[str, Any],
+                allowed_values: Dict[str, FrozenSet[str]]) -> None:
+    """Attach max_file_size_mb to the parameters."""
+    if "max_file_size_mb" in constraints:
+        parameters["_max_file_size_mb"] = constraints["max_file_size_mb"]
+
+
+def _check_metrics(parameters: Dict[str, Any], constraints: Dict[str, Any],
+                   allowed_values: Dict[str, FrozenSet[str]]) -> None:
+    """Check every requested metric against allowed_metrics."""
+    allowed_metrics = constraints.get("allowed_metrics")
+    if allowed_metrics is None:
+        return
+    metrics = parameters.get("metrics")
+    if metrics is None:
+        return
+    if isinstance(metrics, str):
+        metrics = [metrics]
+    allowed = allowed_values.get("allowed_metrics", allowed_metrics)
+    for metric in metrics:
+        if metric not in allowed:
+            raise ValueError(
+                f"Metric '{metric}' not allowed. "
+                f"Allowed metrics: {', '.join(allowed_metrics)}"
+            )
+
+
+def _check_points(parameters: Dict[str, Any], constraints: Dict[str, Any],
+                  allowed_values: Dict[str, FrozenSet[str]]) -> None:
+    """Attach max_data_points to the parameters."""
+    if "max_data_points" in constraints:
+        parameters["_max_data_points"] = constraints["max_data_points"]
+
+
+def _check_severity(parameters: Dict[str, Any], constraints: Dict[str, Any],
+                    allowed_values: Dict[str, FrozenSet[str]]) -> None:
+    """Check the alert severity against allowed_severity_levels."""
+    allowed_levels = constraints.get("allowed_severity_levels")
+    if allowed_levels is None:
+        return
+    severity = parameters.get("severity")
+    allowed = allowed_values.get("allowed_severity_levels", allowed_levels)
+    if severity is not None and str(severity).lower() not in allowed:
+        raise ValueError(
+            f"Severity level '{severity}' not allowed. "
+            f"Allowed levels: {', '.join(allowed_levels)}"
+        )
+
+
+def _check_msglen(parameters: Dict[str, Any], constraints: Dict[str, Any],
+                  allowed_values: Dict[str, FrozenSet[str]]) -> None:
+    """Check the alert message length against max_message_length."""
+    max_length = constraints.get("max_message_length")
+    if max_length is None:
+        return
+    message = parameters.get("message")
+    if message is not None and len(message) > max_length:
+        raise ValueError(
+            f"Alert message exceeds maximum length of {max_length} characters. "
+            f"Current length: {len(message)}"
+        )
+
+
+def _apply_report(parameters: Dict[str, Any], constraints: Dict[str, Any],
+                  allowed_values: Dict[str, FrozenSet[str]]) -> None:
+    """Apply generate_report constraints."""
+    _check_format(parameters, constraints, allowed_values)
+    _check_size(parameters, constraints, allowed_values)
+
+
+def _apply_analysis(parameters: Dict[str, Any], constraints: Dict[str, Any],
+                    allowed_values: Dict[str, FrozenSet[str]]) -> None:
+    """Apply analyze_aqi constraints."""
+    _check_metrics(parameters, constraints, allowed_values)
+    _check_points(parameters, constraints, allowed_values)
+
+
+def _apply_alert(parameters: Dict[str, Any], constraints: Dict[str, Any],
+                 allowed_values: Dict[str, FrozenSet[str]]) -> None:
+    """Apply send_alert constraints."""
+    # The length check is a single integer compare, so it runs before any
+    # inspection of the message or severity strings
+    _check_msglen(parameters, constraints, allowed_values)
+    _check_severity(parameters, constraints, allowed_values)
+
+
+def _noop(parameters: Dict[str, Any], constraints: Dict[str, Any],
+          allowed_values: Dict[str, FrozenSet[str]]) -> None:
+    """Actions without action-specific constraints."""
+
+
+# Constraint application per action, resolved with a single dict lookup
+_APPLY = {
+    "generate_report": _apply_report,
+    "analyze_aqi": _apply_analysis,
+    "send_alert": _apply_alert,
+}
+
+
 class Enforcer:
     """
     Security enforcement layer that validates and executes actions.
@@ -25,7 +146,7 @@ class Enforcer:
     1. Receive intent
     2. Validate against policy
     3. If BLOCKED -> Log and return denial
-    4. If ALLOWED -> Execute and log result
+    4. If ALLOWED -> Apply rule constraints, execute and log result
     
     Attributes:
         policy_engine: PolicyEngine instance for validation
@@ -39,6 +160,44 @@ class Enforcer:
         self.executor = executor
         self.logger = logger
     
+    def apply_constraints(self, intent: Intent, constraints: Optional[Dict[str, Any]],
+                          allowed_values: Optional[Dict[str, FrozenSet[str]]] = None) -> Intent:
+        """
+        Validate intent parameters against policy rule constraints.
+        
+        Checks the action-specific constraints (allowed formats, metrics and
+        severity levels, maximum message length) and attaches the applicable
+        limits to the intent parameters so the executor can honour them.
+        
+        Allowed-value constraints may be given as lists (as loaded from
+        policy.json) or as sets.
+        
+        Args:
+            intent: The intent to check
+            constraints: Constraints from the matched policy rule (may be None)
+            allowed_values: The constraints' allowed-value sets, as returned
+                by PolicyEngine.get_allowed_values(); when omitted, values
+                are checked against the constraints directly
+        
+        Returns:
+            The original intent if there are no constraints, otherwise a new
+            Intent whose parameters include the applied constraints
+        
+        Raises:
+            ValueError: If a parameter violates a policy constraint
+        """
+        if not constraints:
+            return intent
+        
+        if allowed_values is None:
+            allowed_values = {}
+        
+        parameters = dict(intent.parameters)
+        _APPLY.get(intent.action, _noop)(parameters, constraints, allowed_values)
+        
+        parameters["_policy_constraints"] = constraints
+        return replace(intent, parameters=parameters)
+    
     def enforce_and_execute(self, intent: Intent) -> Dict[str, Any]:
         """
         Validate intent against policy and execute if allowed.
@@ -82,8 +241,13 @@ class Enforcer:
                 "policy_decision": policy_decision.to_dict()
             }
         
-        # Step 3: Action is allowed - Execute it
+        # Step 3: Action is allowed - Apply rule constraints and execute it
         try:
+            intent = self.apply_constraints(
+                intent,
+                policy_decision.constraints,
+                self.policy_engine.get_allowed_values(policy_decision.rule_name)
+            )
             result = self.executor.execute(intent)
             
             # Log successful execution
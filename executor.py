@@ -14,7 +14,8 @@ OpenClaw Integration:
 
 import os
 import time
-from typing import Dict, Any
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
 from datetime import datetime
 
 # CRITICAL: OpenClaw integration for hackathon demo
@@ -23,6 +24,32 @@ from openclaw import Computer
 from models import ExecutionResult
 
 
+# Number of locations whose parsed pollution data is kept in memory
+_DATA_CACHE_SIZE = 32
+
+# Pollutants tracked by analyze_aqi(), each with the reading keys it may
+# appear under (PM2.5, pm2.5, PM25, pm25, ...), in lookup order. Built once
+# at import instead of per reading and per pollutant.
+_POLLUTANT_KEYS = tuple(
+    (pollutant, tuple(dict.fromkeys((
+        pollutant,
+        pollutant.lower(),
+        pollutant.replace(".", ""),
+        pollutant.replace(".", "").lower(),
+    ))))
+    for pollutant in ("PM2.5", "PM10", "NO2", "SO2", "CO", "AQI")
+)
+
+
+def _stats(values):
+    """Return (avg, min, max) of a non-empty list of floats, rounded to 2 places."""
+    return (
+        round(sum(values) / len(values), 2),
+        round(min(values), 2),
+        round(max(values), 2),
+    )
+
+
 class Executor:
     """
     Executes approved actions using OpenClaw for system operations.
@@ -78,6 +105,10 @@ class Executor:
         # Using os.makedirs as it's a simple directory creation operation
         if not os.path.exists(self.output_dir):
             os.makedirs(self.output_dir, exist_ok=True)
+        
+        # Parsed pollution data per requested location, with the data files'
+        # mtimes, in least-recently-used order
+        self._data_cache: "OrderedDict[str, Tuple[Tuple[Optional[int], Optional[int]], Dict[str, Any]]]" = OrderedDict()
 
 
     def read_pollution_data(self, location: str) -> Dict[str, Any]:
@@ -185,6 +216,50 @@ class Executor:
             raise ValueError(f"Error reading pollution data for '{location}': {str(e)}")
 
 
+    def _load_pollution_data(self, location: str) -> Dict[str, Any]:
+        """
+        Return pollution data for a location, reusing a previous parse.
+        
+        The cached data is keyed on the location as given, since parsed CSV
+        data records the caller's spelling, and checked against the
+        modification times of its JSON and CSV data files, so edits to the
+        data are picked up on the next call. Only the most recently used
+        locations are kept. The returned data is shared
+        between calls and must not be mutated.
+        
+        Args:
+            location: Name of the location (e.g., "Delhi", "Mumbai")
+        
+        Returns:
+            Parsed pollution data as returned by read_pollution_data()
+        """
+        location_normalized = location.lower().replace(" ", "_")
+        signature = tuple(
+            self._mtime_ns(os.path.join(self.data_dir, f"{location_normalized}_pollution.{ext}"))
+            for ext in ("json", "csv")
+        )
+        
+        cached = self._data_cache.get(location)
+        if cached is not None and cached[0] == signature:
+            self._data_cache.move_to_end(location)
+            return cached[1]
+        
+        data = self.read_pollution_data(location)
+        self._data_cache[location] = (signature, data)
+        self._data_cache.move_to_end(location)
+        while len(self._data_cache) > _DATA_CACHE_SIZE:
+            self._data_cache.popitem(last=False)
+        return data
+    
+    @staticmethod
+    def _mtime_ns(filepath: str) -> Optional[int]:
+        """Return a file's modification time in nanoseconds, or None if missing."""
+        try:
+            return os.stat(filepath).st_mtime_ns
+        except OSError:
+            return None
+
+
     def analyze_aqi(self, location: str) -> Dict[str, Any]:
         """
         Analyze AQI data with statistical calculations.
@@ -195,6 +270,7 @@ class Executor:
         
         The method reads pollution data for the specified location using
         read_pollution_data() and then performs statistical analysis on the data.
+        Parsed data is cached per location until its data file changes.
         
         Args:
             location: Location name (e.g., "Delhi", "Mumbai")
@@ -224,8 +300,8 @@ class Executor:
             >>> print(analysis["summary"]["average_aqi"])
             287.5
         """
-        # Read pollution data for the location
-        data = self.read_pollution_data(location)
+        # Read pollution data for the location (parsed once per file version)
+        data = self._load_pollution_data(location)
         
         # Extract location from data
         location = data.get("location", location)
@@ -236,41 +312,28 @@ class Executor:
         if not readings:
             raise ValueError(f"No pollution data available for analysis in {location}")
         
-        # Initialize pollutant tracking
-        pollutants = ["PM2.5", "PM10", "NO2", "SO2", "CO", "AQI"]
-        pollutant_values = {p: [] for p in pollutants}
-        
         # Extract values for each pollutant
+        pollutant_values = {pollutant: [] for pollutant, _ in _POLLUTANT_KEYS}
         for reading in readings:
-            for pollutant in pollutants:
+            for pollutant, keys in _POLLUTANT_KEYS:
                 # Try different key formats (PM2.5, pm2.5, PM25, pm25, aqi, etc.)
-                value = None
-                possible_keys = [
-                    pollutant,                          # PM2.5
-                    pollutant.lower(),                  # pm2.5
-                    pollutant.replace(".", ""),         # PM25
-                    pollutant.replace(".", "").lower(), # pm25
-                ]
-                
-                for key in possible_keys:
+                for key in keys:
                     if key in reading:
                         try:
-                            value = float(reading[key])
+                            pollutant_values[pollutant].append(float(reading[key]))
                             break
                         except (ValueError, TypeError):
                             continue
-                
-                if value is not None:
-                    pollutant_values[pollutant].append(value)
         
         # Calculate statistics for each pollutant
         pollutant_stats = {}
         for pollutant, values in pollutant_values.items():
             if values:
+                avg, low, high = _stats(values)
                 pollutant_stats[pollutant] = {
-                    "avg": round(sum(values) / len(values), 2),
-                    "min": round(min(values), 2),
-                    "max": round(max(values), 2),
+                    "avg": avg,
+                    "min": low,
+                    "max": high,
                     "count": len(values)
                 }
         
@@ -286,9 +349,12 @@ class Executor:
         if not aqi_values:
             raise ValueError("Insufficient data to calculate AQI")
         
-        avg_aqi = round(sum(aqi_values) / len(aqi_values), 2)
-        min_aqi = round(min(aqi_values), 2)
-        max_aqi = round(max(aqi_values), 2)
+        # Measured AQI stats were already computed with the other pollutants
+        aqi_stats = pollutant_stats.get("AQI")
+        if aqi_stats is not None:
+            avg_aqi, min_aqi, max_aqi = aqi_stats["avg"], aqi_stats["min"], aqi_stats["max"]
+        else:
+            avg_aqi, min_aqi, max_aqi = _stats(aqi_values)
         
         # Calculate trend (simple: compare first half vs second half)
         if len(aqi_values) >= 4:
@@ -541,9 +607,12 @@ class Executor:
         if not message or not isinstance(message, str):
             raise ValueError("Alert message must be a non-empty string")
         
-        # Generate alert ID
+        # Generate alert ID (one clock read and one strftime per alert; the
+        # display timestamp is sliced from the same digits)
         timestamp = datetime.now()
-        alert_id = f"ALERT-{timestamp.strftime('%Y%m%d%H%M%S')}"
+        stamp = timestamp.strftime('%Y%m%d%H%M%S')
+        alert_id = f"ALERT-{stamp}"
+        display_time = f"{stamp[:4]}-{stamp[4:6]}-{stamp[6:8]} {stamp[8:10]}:{stamp[10:12]}:{stamp[12:]}"
         
         # Format alert according to standard template
         alert_template = []
@@ -552,7 +621,7 @@ class Executor:
         alert_template.append("=" * 60)
         alert_template.append("")
         alert_template.append(f"Alert ID: {alert_id}")
-        alert_template.append(f"Timestamp: {timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
+        alert_template.append(f"Timestamp: {display_time}")
         
         if area:
             alert_template.append(f"Affected Area: {area}")
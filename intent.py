@@ -7,7 +7,8 @@ using regex pattern matching and parameter extraction.
 
 import re
 from datetime import datetime
-from typing import Dict, Any, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 from models import Intent
 
 
@@ -35,75 +36,146 @@ class IntentParser:
         {'location': 'Delhi'}
     """
     
+    # Action patterns with their regex patterns and confidence scores. The
+    # patterns are compiled once, when the class is defined, and shared by
+    # every parser instance.
+    _ACTION_PATTERNS = [
+        {
+            'action': 'generate_report',
+            'patterns': [
+                r'\b(generate|create|make|produce)\s+(a\s+)?(pollution\s+)?report\b',
+                r'\breport\s+(for|about|on)\b',
+                r'\bgenerate\s+pollution\s+report\b'
+            ],
+            'keywords': [r'\breport\b'],
+            'base_confidence': 0.9
+        },
+        {
+            'action': 'analyze_aqi',
+            'patterns': [
+                r'\b(analyze|analyse|check|examine|review)\s+(aqi|air\s+quality)\b',
+                r'\b(aqi|air\s+quality)\s+(analysis|check|data)\b',
+                r'\b(analyze|analyse|check)\s+(pollution|air)\b'
+            ],
+            'keywords': [r'\b(aqi|air|pollution)\b'],
+            'base_confidence': 0.9
+        },
+        {
+            'action': 'send_alert',
+            'patterns': [
+                r'\b(send|issue|broadcast|trigger)\s+(an?\s+)?(info|warning|critical|high|low)?\s*(priority\s+)?alert\b',
+                r'\balert\s+(about|for|regarding)\b',
+                r'\bnotify\s+(about|of)\b'
+            ],
+            # The first pattern also matches run-together forms like "infoalert"
+            'keywords': [r'alert\b', r'\bnotify\b'],
+            'base_confidence': 0.9
+        },
+        {
+            'action': 'shutdown_factory',
+            'patterns': [
+                r'\b(shutdown|shut\s+down|close|stop)\s+(the\s+)?factory\b',
+                r'\bfactory\s+(shutdown|closure)\b',
+                r'\bhalt\s+(factory|production)\b'
+            ],
+            'keywords': [r'\b(factory|halt)\b'],
+            'base_confidence': 0.95
+        },
+        {
+            'action': 'issue_fine',
+            'patterns': [
+                r'\b(issue|impose|levy|give)\s+(a\s+)?fine\b',
+                r'\bfine\s+(for|to)\b',
+                r'\b(penalty|penalize)\b'
+            ],
+            'keywords': [r'\b(fine|penalty|penalize)\b'],
+            'base_confidence': 0.95
+        }
+    ]
+    
+    for _action_pattern in _ACTION_PATTERNS:
+        _action_pattern['compiled_patterns'] = [
+            re.compile(pattern, re.IGNORECASE)
+            for pattern in _action_pattern['patterns']
+        ]
+    del _action_pattern
+    
+    # Any match of an action pattern above also matches one of that action's
+    # keyword regexes. A single pass of this pattern over a command finds the
+    # actions that can possibly match, so the others are never searched.
+    _KEYWORD_PATTERN = re.compile(
+        '|'.join(
+            f"(?P<{action_pattern['action']}>{'|'.join(action_pattern['keywords'])})"
+            for action_pattern in _ACTION_PATTERNS
+        ),
+        re.IGNORECASE
+    )
+    # The compiled patterns each action's keywords cover. A parser entry is
+    # only skipped by the prefilter while all of its patterns are in here, so
+    # replaced or added patterns are always searched.
+    _KEYWORD_COVERED = {
+        action_pattern['action']: frozenset(action_pattern['compiled_patterns'])
+        for action_pattern in _ACTION_PATTERNS
+    }
+    
+    # Parameter extraction patterns
+    _LOCATION_PATTERN = re.compile(
+        r'\b(in|for|at|from)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b'
+    )
+    # Common Indian cities, paired with their lowercase form for matching
+    _CITIES = tuple(
+        (city, city.lower())
+        for city in ['Delhi', 'Mumbai', 'Bangalore', 'Chennai', 'Kolkata',
+                     'Hyderabad', 'Pune', 'Ahmedabad', 'Jaipur', 'Lucknow',
+                     'Mayapuri', 'Noida', 'Gurgaon']
+    )
+    _WORD_PATTERN = re.compile(r'\w+')
+    _ASCII_LETTER_PATTERN = re.compile(r'[A-Za-z]')
+    # Action keywords stripped, in order, from alert commands to get the message
+    _ALERT_KEYWORD_PATTERNS = tuple(
+        re.compile(pattern, re.IGNORECASE)
+        for pattern in [
+            r'\b(send|issue|broadcast|trigger)\s+(an?\s+)?',
+            r'\b(info|warning|critical|high|low)?\s*(priority\s+)?alert\s+(about|for|regarding)?\s*',
+            r'\balert\s+(about|for|regarding)\s*',
+            r'\bnotify\s+(about|of)\s*'
+        ]
+    )
+    # Severity terms mapped to the standard levels: info, warning, critical
+    _SEVERITY_WORDS = {
+        'info': 'info',
+        'information': 'info',
+        'low': 'info',
+        'warning': 'warning',
+        'critical': 'critical',
+        'severe': 'critical',
+        'high': 'critical'
+    }
+    _FILENAME_PATTERN = re.compile(
+        r'\b([a-zA-Z0-9_-]+\.(json|csv|txt|pdf))\b'
+    )
+    
     def __init__(self):
         """Initialize the intent parser with action patterns."""
-        # Define action patterns with their regex patterns and confidence scores
+        # Per-instance pattern table. The lists are copied so in-place edits
+        # stay local to this parser; the compiled regexes themselves are shared.
         self.action_patterns = [
-            {
-                'action': 'generate_report',
-                'patterns': [
-                    r'\b(generate|create|make|produce)\s+(a\s+)?(pollution\s+)?report\b',
-                    r'\breport\s+(for|about|on)\b',
-                    r'\bgenerate\s+pollution\s+report\b'
-                ],
-                'base_confidence': 0.9
-            },
-            {
-                'action': 'analyze_aqi',
-                'patterns': [
-                    r'\b(analyze|analyse|check|examine|review)\s+(aqi|air\s+quality)\b',
-                    r'\b(aqi|air\s+quality)\s+(analysis|check|data)\b',
-                    r'\b(analyze|analyse|check)\s+(pollution|air)\b'
-                ],
-                'base_confidence': 0.9
-            },
-            {
-                'action': 'send_alert',
-                'patterns': [
-                    r'\b(send|issue|broadcast|trigger)\s+(an?\s+)?(info|warning|critical|high|low)?\s*(priority\s+)?alert\b',
-                    r'\balert\s+(about|for|regarding)\b',
-                    r'\bnotify\s+(about|of)\b'
-                ],
-                'base_confidence': 0.9
-            },
-            {
-                'action': 'shutdown_factory',
-                'patterns': [
-                    r'\b(shutdown|shut\s+down|close|stop)\s+(the\s+)?factory\b',
-                    r'\bfactory\s+(shutdown|closure)\b',
-                    r'\bhalt\s+(factory|production)\b'
-                ],
-                'base_confidence': 0.95
-            },
-            {
-                'action': 'issue_fine',
-                'patterns': [
-                    r'\b(issue|impose|levy|give)\s+(a\s+)?fine\b',
-                    r'\bfine\s+(for|to)\b',
-                    r'\b(penalty|penalize)\b'
-                ],
-                'base_confidence': 0.95
-            }
+            dict(
+                action_pattern,
+                patterns=list(action_pattern['patterns']),
+                keywords=list(action_pattern['keywords']),
+                compiled_patterns=list(action_pattern['compiled_patterns'])
+            )
+            for action_pattern in self._ACTION_PATTERNS
         ]
         
-        # Compile regex patterns for efficiency
-        for action_pattern in self.action_patterns:
-            action_pattern['compiled_patterns'] = [
-                re.compile(pattern, re.IGNORECASE) 
-                for pattern in action_pattern['patterns']
-            ]
-        
         # Parameter extraction patterns
-        self.location_pattern = re.compile(
-            r'\b(in|for|at|from)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b'
-        )
-        self.severity_pattern = re.compile(
-            r'\b(info|information|warning|critical|severe|high|low)\b',
-            re.IGNORECASE
-        )
-        self.filename_pattern = re.compile(
-            r'\b([a-zA-Z0-9_-]+\.(json|csv|txt|pdf))\b'
-        )
+        self.location_pattern = self._LOCATION_PATTERN
+        self.filename_pattern = self._FILENAME_PATTERN
+        
+        # Memoized parse results per normalized command. The key keeps the
+        # original case, since location extraction is case-sensitive.
+        self._parse_core = lru_cache(maxsize=1024)(self._parse_normalized)
     
     def parse_intent(self, command: str) -> Intent:
         """
@@ -130,30 +202,97 @@ class IntentParser:
             >>> intent.parameters['location']
             'Delhi'
         """
+        return self._parse(command, datetime.now())
+    
+    def parse_intent_batch(self, commands: Iterable[str]) -> List[Intent]:
+        """
+        Parse several natural language commands in one call.
+        
+        Each command is parsed exactly as parse_intent() would parse it, but
+        the clock is read once and every intent in the batch shares that
+        timestamp.
+        
+        Args:
+            commands: Natural language command strings
+            
+        Returns:
+            List of Intent objects, in the same order as the commands
+            
+        Example:
+            >>> parser = IntentParser()
+            >>> [i.action for i in parser.parse_intent_batch(["Analyze AQI", "Send alert"])]
+            ['analyze_aqi', 'send_alert']
+        """
+        timestamp = datetime.now()
+        return [self._parse(command, timestamp) for command in commands]
+    
+    def _parse(self, command: str, timestamp: datetime) -> Intent:
+        """
+        Parse a single command into an Intent stamped with the given time.
+        
+        Args:
+            command: Natural language command string
+            timestamp: Timestamp to record on the intent
+            
+        Returns:
+            Intent object (action='error' for empty or invalid commands)
+        """
         if not command or not isinstance(command, str):
-            return self._create_error_intent(command, "Empty or invalid command")
+            return self._create_error_intent(command, "Empty or invalid command", timestamp)
         
         # Normalize command
         normalized_command = command.strip()
         
         if not normalized_command:
-            return self._create_error_intent(command, "Empty command after normalization")
-        
-        # Match action patterns
-        action, confidence = self._match_action(normalized_command)
+            return self._create_error_intent(command, "Empty command after normalization", timestamp)
         
-        # Extract parameters based on action type
-        parameters = self._extract_parameters(normalized_command, action)
+        action, parameters, confidence = self._parse_core(normalized_command)
         
-        # Create and return intent
+        # Create and return intent; each intent gets its own parameters dict
         return Intent(
             action=action,
-            parameters=parameters,
-            timestamp=datetime.now(),
+            parameters=dict(parameters),
+            timestamp=timestamp,
             user_command=command,
             confidence=confidence
         )
     
+    def _parse_normalized(self, command: str) -> Tuple[str, Tuple[Tuple[str, Any], ...], float]:
+        """
+        Match the action and extract parameters for a normalized command.
+        
+        Results are memoized per command (see __init__), so the parameters
+        are returned as a tuple of (name, value) pairs that callers turn
+        into a fresh dict.
+        
+        Args:
+            command: Stripped, non-empty command string
+            
+        Returns:
+            Tuple of (action_name, parameter_items, confidence_score)
+        """
+        # Every action keyword, location and city needs an ASCII letter, so
+        # commands without one (punctuation, digits, other scripts) can't match
+        if not self._ASCII_LETTER_PATTERN.search(command):
+            return 'unknown', (), 0.0
+        
+        # Match action patterns
+        action, confidence = self._match_action(command)
+        
+        # Extract parameters based on action type
+        parameters = self._extract_parameters(command, action)
+        
+        return action, tuple(parameters.items()), confidence
+    
+    def clear_cache(self) -> None:
+        """
+        Discard memoized parse results.
+        
+        Call this after changing action_patterns so later commands are
+        parsed with the new patterns.
+        """
+        self._parse_core.cache_clear()
+    
     def _match_action(self, command: str) -> Tuple[str, float]:
         """
         Match command against action patterns to identify the action type.
@@ -166,8 +305,17 @@ class IntentParser:
         """
         best_match = None
         best_confidence = 0.0
+        candidates = {match.lastgroup for match in self._KEYWORD_PATTERN.finditer(command)}
+        
+        keyword_covered = self._KEYWORD_COVERED
         
         for action_pattern in self.action_patterns:
+            action = action_pattern['action']
+            if action not in candidates:
+                covered = keyword_covered.get(action)
+                if covered is not None and covered.issuperset(action_pattern['compiled_patterns']):
+                    continue
+            
             for compiled_pattern in action_pattern['compiled_patterns']:
                 match = compiled_pattern.search(command)
                 if match:
@@ -251,7 +399,7 @@ class IntentParser:
             severity = self._extract_severity(command)
             parameters['severity'] = severity if severity else 'warning'
             # Extract message from command (use the command itself as message if not specified)
-            parameters['message'] = self._extract_alert_message(command)
+            parameters['message'] = self._extract_alert_message(command, location)
         
         # Extract filename (for reports)
         if action == 'generate_report':
@@ -277,14 +425,10 @@ class IntentParser:
         if match:
             return match.group(2)
         
-        # Try to find capitalized words that might be locations
-        # Common Indian cities
-        cities = ['Delhi', 'Mumbai', 'Bangalore', 'Chennai', 'Kolkata', 
-                  'Hyderabad', 'Pune', 'Ahmedabad', 'Jaipur', 'Lucknow',
-                  'Mayapuri', 'Noida', 'Gurgaon']
-        
-        for city in cities:
-            if city.lower() in command.lower():
+        # Try to find known city names anywhere in the command
+        command_lower = command.lower()
+        for city, city_lower in self._CITIES:
+            if city_lower in command_lower:
                 return city
         
         return None
@@ -301,17 +445,13 @@ class IntentParser:
         Returns:
             Severity level or None if not found
         """
-        match = self.severity_pattern.search(command)
-        if match:
-            severity_text = match.group(1).lower()
-            
-            # Map to standard severity levels
-            if severity_text in ['info', 'information', 'low']:
-                return 'info'
-            elif severity_text in ['warning']:
-                return 'warning'
-            elif severity_text in ['critical', 'severe', 'high']:
-                return 'critical'
+        # Whole words, in order, looked up in the severity table; the first
+        # severity term in the command wins
+        severity_words = self._SEVERITY_WORDS
+        for word in self._WORD_PATTERN.findall(command.lower()):
+            severity = severity_words.get(word)
+            if severity is not None:
+                return severity
         
         return None
     
@@ -333,7 +473,7 @@ class IntentParser:
         
         return None
     
-    def _extract_alert_message(self, command: str) -> str:
+    def _extract_alert_message(self, command: str, location: Optional[str]) -> str:
         """
         Extract alert message from command.
         
@@ -341,6 +481,7 @@ class IntentParser:
         
         Args:
             command: The command string
+            location: Location already extracted from the command, if any
             
         Returns:
             Alert message string
@@ -349,22 +490,14 @@ class IntentParser:
         message = command
         
         # Remove action keywords
-        keywords_to_remove = [
-            r'\b(send|issue|broadcast|trigger)\s+(an?\s+)?',
-            r'\b(info|warning|critical|high|low)?\s*(priority\s+)?alert\s+(about|for|regarding)?\s*',
-            r'\balert\s+(about|for|regarding)\s*',
-            r'\bnotify\s+(about|of)\s*'
-        ]
-        
-        for keyword_pattern in keywords_to_remove:
-            message = re.sub(keyword_pattern, '', message, flags=re.IGNORECASE)
+        for keyword_pattern in self._ALERT_KEYWORD_PATTERNS:
+            message = keyword_pattern.sub('', message)
         
         # Clean up extra whitespace
         message = ' '.join(message.split())
         
         # If message is empty or too short, use a default
         if not message or len(message) < 5:
-            location = self._extract_location(command)
             if location:
                 message = f"High pollution levels detected in {location}"
             else:
@@ -372,13 +505,15 @@ class IntentParser:
         
         return message.strip()
     
-    def _create_error_intent(self, command: str, error_message: str) -> Intent:
+    def _create_error_intent(self, command: str, error_message: str,
+                             timestamp: Optional[datetime] = None) -> Intent:
         """
         Create an error intent for invalid or unparseable commands.
         
         Args:
             command: The original command (may be invalid)
             error_message: Description of the error
+            timestamp: Timestamp to record (default: now)
             
         Returns:
             Intent object with action='error' and error details
@@ -386,7 +521,7 @@ class IntentParser:
         return Intent(
             action='error',
             parameters={'error': error_message, 'original_command': command},
-            timestamp=datetime.now(),
+            timestamp=timestamp or datetime.now(),
             user_command=command if command else '',
             confidence=0.0
         )
@@ -412,30 +547,40 @@ class IntentParser:
             return False
         
         try:
-            # Check action
-            if not intent.action or not isinstance(intent.action, str):
-                return False
-            
-            # Check parameters
-            if not isinstance(intent.parameters, dict):
-                return False
+            # Straight-line checks on the known Intent fields; each field is
+            # read directly, and only the two used twice are bound to locals
+            action = intent.action
+            confidence = intent.confidence
             
-            # Check timestamp
-            if not isinstance(intent.timestamp, datetime):
-                return False
-            
-            # Check confidence
-            if not isinstance(intent.confidence, (int, float)):
-                return False
-            
-            if not (0.0 <= intent.confidence <= 1.0):
-                return False
-            
-            # Check user_command
-            if not isinstance(intent.user_command, str):
-                return False
-            
-            return True
+            return (
+                bool(action) and isinstance(action, str)
+                and isinstance(intent.parameters, dict)
+                and isinstance(intent.timestamp, datetime)
+                and isinstance(confidence, (int, float))
+                # NaN fails both comparisons, so it needs no separate check
+                and 0.0 <= confidence <= 1.0
+                and isinstance(intent.user_command, str)
+            )
             
         except (AttributeError, TypeError):
             return False
+    
+    def validate_intent_structures(self, intents: Iterable[Optional[Intent]]) -> List[bool]:
+        """
+        Validate several intents in one call.
+        
+        Each intent is checked exactly as validate_intent_structure() would
+        check it.
+        
+        Args:
+            intents: Intent objects to validate
+            
+        Returns:
+            List of validation results, in the same order as the intents
+            
+        Example:
+            >>> parser = IntentParser()
+            >>> parser.validate_intent_structures([parser.parse_intent("Analyze AQI"), None])
+            [True, False]
+        """
+        return list(map(self.validate_intent_structure, intents))
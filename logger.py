@@ -9,11 +9,31 @@ compliance, debugging, and security monitoring.
 import json
 import os
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Iterator, Tuple, Union
 from pathlib import Path
 
 from models import Intent, PolicyDecision, ExecutionResult
 
+# orjson is an optional, faster parser for reading logs back. Entries are
+# always written with the stdlib json module so the log format is the same
+# whether or not orjson is installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads(line: Union[str, bytes]) -> Any:
+    """Parse one JSON log line, using orjson when it is available."""
+    if orjson is None:
+        return json.loads(line)
+    try:
+        return orjson.loads(line)
+    except orjson.JSONDecodeError:
+        # orjson is stricter than json (e.g. NaN, huge integers); let the
+        # stdlib parser decide whether the line is really corrupted
+        return json.loads(line)
+
 
 class AuditLogger:
     """
@@ -85,6 +105,59 @@ class AuditLogger:
             >>> logger.log_action(intent, decision, None, "BLOCKED")
             >>> logger.log_action(None, None, None, "ERROR")
         """
+        log_entry = self._build_entry(intent, policy_decision, result, status)
+        
+        # Write log entry as JSON line (append-only)
+        try:
+            with open(self.log_file, "a", encoding="utf-8") as f:
+                json.dump(log_entry, f)
+                f.write("\n")  # Each entry on its own line
+        except Exception as e:
+            # If logging fails, print to stderr but don't crash the system
+            print(f"ERROR: Failed to write audit log: {e}", file=__import__('sys').stderr)
+    
+    def log_action_many(
+        self,
+        entries: Iterable[Tuple[Optional[Intent], Optional[PolicyDecision], Optional[ExecutionResult], str]]
+    ) -> None:
+        """
+        Log several actions with a single append to the log file.
+        
+        Each entry is an (intent, policy_decision, result, status) tuple, logged
+        exactly as log_action() would log it. The log file is opened once and
+        all entries are written in one call.
+        
+        Args:
+            entries: Iterable of (intent, policy_decision, result, status) tuples
+        
+        Example:
+            >>> logger.log_action_many([
+            ...     (intent, decision, result, "SUCCESS"),
+            ...     (intent, blocked_decision, None, "BLOCKED"),
+            ... ])
+        """
+        lines = [
+            json.dumps(self._build_entry(intent, policy_decision, result, status)) + "\n"
+            for intent, policy_decision, result, status in entries
+        ]
+        if not lines:
+            return
+        
+        try:
+            with open(self.log_file, "a", encoding="utf-8") as f:
+                f.write("".join(lines))
+        except Exception as e:
+            # If logging fails, print to stderr but don't crash the system
+            print(f"ERROR: Failed to write audit log: {e}", file=__import__('sys').stderr)
+    
+    @staticmethod
+    def _build_entry(
+        intent: Optional[Intent],
+        policy_decision: Optional[PolicyDecision],
+        result: Optional[ExecutionResult],
+        status: str
+    ) -> Dict[str, Any]:
+        """Build the structured log entry for one action."""
         # Create log entry with timestamp
         log_entry = {
             "timestamp": datetime.now().isoformat(),
@@ -109,14 +182,7 @@ class AuditLogger:
         else:
             log_entry["result"] = None
         
-        # Write log entry as JSON line (append-only)
-        try:
-            with open(self.log_file, "a", encoding="utf-8") as f:
-                json.dump(log_entry, f)
-                f.write("\n")  # Each entry on its own line
-        except Exception as e:
-            # If logging fails, print to stderr but don't crash the system
-            print(f"ERROR: Failed to write audit log: {e}", file=__import__('sys').stderr)
+        return log_entry
 
     def get_logs(
         self,
@@ -131,6 +197,10 @@ class AuditLogger:
         that match the specified filters. Handles missing or corrupted log files
         gracefully.
         
+        With a status_filter, lines that do not contain the status are skipped
+        without being decoded, so a corrupted line is only reported when it
+        contains the filtered status.
+        
         Args:
             start_time: Optional start time for filtering (inclusive)
             end_time: Optional end time for filtering (inclusive)
@@ -157,47 +227,55 @@ class AuditLogger:
         if not self.log_file.exists():
             return logs  # Return empty list if no logs yet
         
+        # A matching entry must contain the status as a JSON string literal,
+        # so lines without it can be skipped before decoding. The check does
+        # not depend on key order or separators; the decoded status is still
+        # compared exactly below.
+        status_needle = json.dumps(status_filter).encode() if status_filter is not None else None
+        
         try:
-            with open(self.log_file, "r", encoding="utf-8") as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-                    if not line:
-                        continue  # Skip empty lines
+            for line_num, line in self._iter_lines():
+                line = line.strip()
+                if not line:
+                    continue  # Skip empty lines
+                
+                if status_needle is not None and status_needle not in line:
+                    continue
+                
+                try:
+                    # Parse JSON log entry
+                    log_entry = _loads(line)
                     
-                    try:
-                        # Parse JSON log entry
-                        log_entry = json.loads(line)
-                        
-                        # Parse timestamp for filtering
-                        entry_time = datetime.fromisoformat(log_entry["timestamp"])
-                        
-                        # Apply time range filters
-                        if start_time is not None and entry_time < start_time:
-                            continue
-                        if end_time is not None and entry_time > end_time:
-                            continue
-                        
-                        # Apply status filter
-                        if status_filter is not None and log_entry.get("status") != status_filter:
-                            continue
-                        
-                        # Entry matches all filters
-                        logs.append(log_entry)
-                        
-                    except json.JSONDecodeError as e:
-                        # Handle corrupted log entry - log warning but continue
-                        print(
-                            f"WARNING: Corrupted log entry at line {line_num}: {e}",
-                            file=__import__('sys').stderr
-                        )
+                    # Parse timestamp for filtering
+                    entry_time = datetime.fromisoformat(log_entry["timestamp"])
+                    
+                    # Apply time range filters
+                    if start_time is not None and entry_time < start_time:
+                        continue
+                    if end_time is not None and entry_time > end_time:
                         continue
-                    except (KeyError, ValueError) as e:
-                        # Handle malformed log entry
-                        print(
-                            f"WARNING: Malformed log entry at line {line_num}: {e}",
-                            file=__import__('sys').stderr
-                        )
+                    
+                    # Apply status filter
+                    if status_filter is not None and log_entry.get("status") != status_filter:
                         continue
+                    
+                    # Entry matches all filters
+                    logs.append(log_entry)
+                    
+                except json.JSONDecodeError as e:
+                    # Handle corrupted log entry - log warning but continue
+                    print(
+                        f"WARNING: Corrupted log entry at line {line_num}: {e}",
+                        file=__import__('sys').stderr
+                    )
+                    continue
+                except (KeyError, ValueError) as e:
+                    # Handle malformed log entry
+                    print(
+                        f"WARNING: Malformed log entry at line {line_num}: {e}",
+                        file=__import__('sys').stderr
+                    )
+                    continue
         
         except Exception as e:
             # Handle file read errors gracefully
@@ -205,3 +283,14 @@ class AuditLogger:
             return []
         
         return logs
+    
+    def _iter_lines(self) -> Iterator[Tuple[int, bytes]]:
+        """
+        Return (line_number, raw_line) pairs from the log file.
+        
+        The whole file is read in one call and split on newlines, so a file
+        truncated or rewritten mid-read only yields fewer lines.
+        """
+        with open(self.log_file, "rb") as f:
+            content = f.read()
+        return enumerate(content.split(b"\n"), 1)
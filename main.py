@@ -10,13 +10,23 @@ for the hackathon judges. It shows:
 5. Audit logging
 """
 
-from agent import AirGuardAgent
 import json
 
 
+# Static demo output, built once at import time
+_SEPARATOR = "\n" + "=" * 80 + "\n"
+_BANNER = (
+    "=" * 80 + "\n"
+    "🌍 AIRGUARD AI - AUTONOMOUS POLLUTION MONITORING SYSTEM\n"
+    + "=" * 80 + "\n"
+    "\nDemo for Hackathon Judges\n"
+    "Showing: Intent Parsing, Policy Enforcement, OpenClaw Integration, Audit Logging"
+)
+
+
 def print_separator():
     """Print a visual separator."""
-    print("\n" + "="*80 + "\n")
+    print(_SEPARATOR)
 
 
 def print_result(result):
@@ -36,13 +46,13 @@ def print_result(result):
 def main():
     """Run the AirGuard AI demo."""
     
-    print("="*80)
-    print("🌍 AIRGUARD AI - AUTONOMOUS POLLUTION MONITORING SYSTEM")
-    print("="*80)
-    print("\nDemo for Hackathon Judges")
-    print("Showing: Intent Parsing, Policy Enforcement, OpenClaw Integration, Audit Logging")
+    print(_BANNER)
     print_separator()
     
+    # Import the agent lazily so the banner is printed before the full
+    # component stack (parser, policy, executor, logger) is loaded
+    from agent import AirGuardAgent
+    
     # Initialize the agent
     agent = AirGuardAgent()
     
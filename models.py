@@ -12,11 +12,19 @@ from typing import Dict, Any, Optional, List
 from datetime import datetime
 
 
-@dataclass
+# Numeric types accepted by the validators below. Plain int/float values are
+# recognised by an exact type check; subclasses fall back to isinstance().
+_NUMBER_TYPES = (int, float)
+
+
+@dataclass(frozen=True)
 class Intent:
     """
     Structured representation of a user command.
     
+    Intents are immutable; use dataclasses.replace() to derive a changed
+    copy. The parameters dict itself can still be modified.
+    
     Attributes:
         action: The type of action to perform (e.g., "generate_report", "analyze_aqi")
         parameters: Action-specific parameters extracted from the command
@@ -33,6 +41,9 @@ class Intent:
         ...     confidence=0.95
         ... )
     """
+    # Declared by hand rather than with slots=True, which needs Python 3.10
+    __slots__ = ('action', 'parameters', 'timestamp', 'user_command', 'confidence')
+    
     action: str
     parameters: Dict[str, Any]
     timestamp: datetime
@@ -50,9 +61,20 @@ class Intent:
         if not isinstance(self.timestamp, datetime):
             raise ValueError("timestamp must be a datetime object")
         
-        if not isinstance(self.confidence, (int, float)) or not (0.0 <= self.confidence <= 1.0):
+        confidence = self.confidence
+        if (type(confidence) not in _NUMBER_TYPES and not isinstance(confidence, _NUMBER_TYPES)) \
+                or not (0.0 <= confidence <= 1.0):
             raise ValueError("confidence must be a float between 0.0 and 1.0")
     
+    def __getstate__(self):
+        """Return the field values for copy and pickle (there is no __dict__)."""
+        return tuple(getattr(self, name) for name in self.__slots__)
+    
+    def __setstate__(self, state):
+        """Restore field values; the frozen __setattr__ would reject them."""
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+    
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert intent to dictionary for logging and serialization.
@@ -160,7 +182,9 @@ class ExecutionResult:
         if self.data is not None and not isinstance(self.data, dict):
             raise ValueError("data must be a dictionary or None")
         
-        if not isinstance(self.execution_time, (int, float)) or self.execution_time < 0:
+        execution_time = self.execution_time
+        if (type(execution_time) not in _NUMBER_TYPES and not isinstance(execution_time, _NUMBER_TYPES)) \
+                or execution_time < 0:
             raise ValueError("execution_time must be a non-negative number")
         
         if not isinstance(self.files_created, list):
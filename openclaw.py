@@ -149,7 +149,12 @@ class Computer:
             >>> pc = Computer()
             >>> pc.open_file("output/report.pdf")
         """
-        if os.path.exists(filepath):
-            print(f"[OpenClaw] Would open file: {filepath}")
-            return True
-        return False
+        # A single stat() both checks existence and provides the size. Any
+        # stat failure means the file can't be opened, as with os.path.exists
+        try:
+            st = os.stat(filepath)
+        except (OSError, ValueError):
+            return False
+        
+        print(f"[OpenClaw] Would open file: {filepath} ({st.st_size} bytes)")
+        return True
@@ -7,10 +7,22 @@ policy rules to determine if intents are allowed, blocked, or require special ha
 
 import json
 import os
-from typing import Dict, Any, List, Optional
+from functools import cached_property
+from typing import Dict, Any, FrozenSet, List, Optional
 from models import Intent, PolicyDecision
 
 
+def _allowed_value_sets(constraints: Optional[Dict[str, Any]]) -> Dict[str, FrozenSet[str]]:
+    """Return the allowed_* lists in rule constraints as frozensets."""
+    if not constraints:
+        return {}
+    return {
+        key: frozenset(values)
+        for key, values in constraints.items()
+        if key.startswith("allowed_") and isinstance(values, (list, tuple, set, frozenset))
+    }
+
+
 class PolicyEngine:
     """
     Policy Engine that validates intents against security policy rules.
@@ -57,61 +69,62 @@ class PolicyEngine:
         self.rules: List[Dict[str, Any]] = []
         self.default_policy: str = "deny"
         self.default_reason: str = "Action not explicitly allowed by security policy"
+        self._default_decision: Optional[PolicyDecision] = None
+        self._decisions: Dict[str, PolicyDecision] = {}
+        self._allowed_values: Dict[str, Dict[str, FrozenSet[str]]] = {}
         
         # Load policy rules from file
         self._load_policy()
     
-    def _load_policy(self) -> None:
+    def _load_policy(self, policy_data: Optional[Dict[str, Any]] = None) -> None:
         """
         Load and parse policy rules from JSON file.
         
         This method reads the policy file, validates its structure, and
         extracts the rules, default policy, and default reason.
         
+        Args:
+            policy_data: Already-parsed policy configuration to use instead
+                of reading the policy file
+        
         Raises:
             FileNotFoundError: If policy file doesn't exist
             json.JSONDecodeError: If policy file is invalid JSON
             ValueError: If policy file is missing required fields
         """
-        # Check if policy file exists
-        if not os.path.exists(self.policy_file):
-            raise FileNotFoundError(
-                f"Policy file not found: {self.policy_file}. "
-                "Please ensure policy.json exists in the current directory."
-            )
-        
-        try:
-            # Read and parse JSON file
-            with open(self.policy_file, 'r', encoding='utf-8') as f:
-                self.policy_data = json.load(f)
-        except json.JSONDecodeError as e:
-            raise json.JSONDecodeError(
-                f"Invalid JSON in policy file: {self.policy_file}",
-                e.doc,
-                e.pos
-            )
+        if policy_data is None:
+            # Check if policy file exists
+            if not os.path.exists(self.policy_file):
+                raise FileNotFoundError(
+                    f"Policy file not found: {self.policy_file}. "
+                    "Please ensure policy.json exists in the current directory."
+                )
+            
+            try:
+                # Read and parse JSON file
+                with open(self.policy_file, 'r', encoding='utf-8') as f:
+                    policy_data = json.load(f)
+            except json.JSONDecodeError as e:
+                raise json.JSONDecodeError(
+                    f"Invalid JSON in policy file: {self.policy_file}",
+                    e.doc,
+                    e.pos
+                )
         
-        # Validate required fields
-        if "rules" not in self.policy_data:
+        # Validate required fields before replacing the current policy, so a
+        # rejected configuration leaves the engine unchanged
+        if "rules" not in policy_data:
             raise ValueError(
                 f"Policy file {self.policy_file} is missing required 'rules' field"
             )
         
-        if not isinstance(self.policy_data["rules"], list):
+        if not isinstance(policy_data["rules"], list):
             raise ValueError(
                 f"Policy file {self.policy_file} 'rules' field must be a list"
             )
         
-        # Extract policy configuration
-        self.rules = self.policy_data["rules"]
-        self.default_policy = self.policy_data.get("default_policy", "deny")
-        self.default_reason = self.policy_data.get(
-            "default_reason",
-            "Action not explicitly allowed by security policy"
-        )
-        
         # Validate each rule has required fields
-        for i, rule in enumerate(self.rules):
+        for i, rule in enumerate(policy_data["rules"]):
             if "action" not in rule:
                 raise ValueError(
                     f"Policy rule at index {i} is missing required 'action' field"
@@ -124,6 +137,46 @@ class PolicyEngine:
                 raise ValueError(
                     f"Policy rule at index {i} is missing required 'reason' field"
                 )
+        
+        # Extract policy configuration
+        self.policy_data = policy_data
+        self.rules = policy_data["rules"]
+        self.default_policy = policy_data.get("default_policy", "deny")
+        self.default_reason = policy_data.get(
+            "default_reason",
+            "Action not explicitly allowed by security policy"
+        )
+        
+        # Drop derived views computed from the previous configuration
+        self.__dict__.pop("_allowed_actions", None)
+        self.__dict__.pop("_policy_info", None)
+        
+        # The default decision only depends on the loaded configuration, so it
+        # is built once here instead of on every unmatched validation
+        self._default_decision = PolicyDecision(
+            allowed=(self.default_policy == "allow"),
+            reason=self.default_reason,
+            rule_name="default",
+            constraints=None
+        )
+        
+        # Index one decision per action. Rules are matched in file order, so
+        # the first rule for an action wins, as with a linear scan. The
+        # matching rule's allowed-value sets are built alongside, so
+        # enforcement never converts the constraint lists itself.
+        decisions: Dict[str, PolicyDecision] = {}
+        allowed_values: Dict[str, Dict[str, FrozenSet[str]]] = {}
+        for rule in self.rules:
+            if rule["action"] not in decisions:
+                decisions[rule["action"]] = PolicyDecision(
+                    allowed=rule["allowed"],
+                    reason=rule["reason"],
+                    rule_name=rule["action"],
+                    constraints=rule.get("constraints")
+                )
+                allowed_values[rule["action"]] = _allowed_value_sets(rule.get("constraints"))
+        self._decisions = decisions
+        self._allowed_values = allowed_values
     
     def validate_intent(self, intent: Intent) -> PolicyDecision:
         """
@@ -133,6 +186,9 @@ class PolicyEngine:
         It returns a PolicyDecision with the allowed status, reason, and any
         constraints that should be applied during execution.
         
+        Decisions are built once per policy load and shared between calls,
+        so callers should treat them as read-only.
+        
         Args:
             intent: The intent to validate
         
@@ -147,26 +203,25 @@ class PolicyEngine:
             >>> print(decision.reason)
             'Critical infrastructure control requires human authorization'
         """
-        # Search for matching rule
-        for rule in self.rules:
-            if rule["action"] == intent.action:
-                # Found matching rule - return decision based on rule
-                return PolicyDecision(
-                    allowed=rule["allowed"],
-                    reason=rule["reason"],
-                    rule_name=rule["action"],
-                    constraints=rule.get("constraints")
-                )
+        # Look up the decision for the matching rule, or apply the default
+        # policy when no rule matches
+        return self._decisions.get(intent.action, self._default_decision)
+    
+    def get_allowed_values(self, rule_name: str) -> Dict[str, FrozenSet[str]]:
+        """
+        Get the allowed-value sets for a policy rule's constraints.
         
-        # No matching rule found - apply default policy
-        default_allowed = (self.default_policy == "allow")
+        The sets are built once per policy load and shared between calls,
+        so callers should treat them as read-only.
         
-        return PolicyDecision(
-            allowed=default_allowed,
-            reason=self.default_reason,
-            rule_name="default",
-            constraints=None
-        )
+        Args:
+            rule_name: Rule name from a PolicyDecision
+        
+        Returns:
+            Dictionary mapping each allowed_* constraint key to a frozenset
+            of its values; empty if the rule has none
+        """
+        return self._allowed_values.get(rule_name, {})
     
     def get_allowed_actions(self) -> List[str]:
         """
@@ -184,21 +239,24 @@ class PolicyEngine:
             >>> print(allowed)
             ['generate_report', 'analyze_aqi', 'send_alert']
         """
-        allowed_actions = []
-        
-        for rule in self.rules:
-            if rule.get("allowed", False):
-                allowed_actions.append(rule["action"])
-        
-        return allowed_actions
+        return list(self._allowed_actions)
     
-    def reload_policy(self) -> bool:
+    @cached_property
+    def _allowed_actions(self) -> List[str]:
+        """Allowed action names, computed once per policy load."""
+        return [rule["action"] for rule in self.rules if rule.get("allowed", False)]
+    
+    def reload_policy(self, policy_data: Optional[Dict[str, Any]] = None) -> bool:
         """
         Reload policy rules from file.
         
         This method allows runtime updates to the policy without restarting
         the system. Useful for updating security rules dynamically.
         
+        Args:
+            policy_data: Already-parsed policy configuration to load instead
+                of re-reading the policy file. It is validated the same way.
+        
         Returns:
             True if policy was successfully reloaded, False otherwise
         
@@ -210,7 +268,7 @@ class PolicyEngine:
             True
         """
         try:
-            self._load_policy()
+            self._load_policy(policy_data)
             return True
         except (FileNotFoundError, json.JSONDecodeError, ValueError) as e:
             # Log error but don't crash - keep using existing policy
@@ -221,6 +279,9 @@ class PolicyEngine:
         """
         Get information about the current policy configuration.
         
+        The metadata is computed once per policy load; each call returns a
+        fresh copy, so callers may modify it freely.
+        
         Returns:
             Dictionary with policy metadata including version, rules count,
             default policy, and allowed actions
@@ -231,6 +292,12 @@ class PolicyEngine:
             >>> print(info["version"])
             '1.0'
         """
+        info = self._policy_info
+        return {**info, "allowed_actions": list(info["allowed_actions"])}
+    
+    @cached_property
+    def _policy_info(self) -> Dict[str, Any]:
+        """Policy metadata, computed once per policy load."""
         return {
             "version": self.policy_data.get("version", "unknown"),
             "description": self.policy_data.get("description", ""),
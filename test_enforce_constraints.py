@@ -6,236 +6,186 @@ and applies policy constraints before execution.
 """
 
 import pytest
-from datetime import datetime
-from models import Intent, PolicyDecision, ExecutionResult
+from types import MappingProxyType
 from enforce import Enforcer
 from executor import Executor
 from logger import AuditLogger
+from policy import PolicyEngine
+
+
+# Shared, read-only test data. Constraint mappings are wrapped in
+# MappingProxyType so tests can share them without defensive copies.
+_FORMAT_CONSTRAINTS = MappingProxyType({
+    "allowed_formats": frozenset({"txt", "json", "pdf"}),
+    "max_file_size_mb": 10
+})
+_METRIC_CONSTRAINTS = MappingProxyType({
+    "allowed_metrics": frozenset({"PM2.5", "PM10", "NO2", "SO2", "CO", "O3"}),
+    "max_data_points": 10000
+})
+_SEVERITY_CONSTRAINTS = MappingProxyType({
+    "allowed_severity_levels": frozenset({"info", "warning", "critical"}),
+    "max_message_length": 500
+})
+_MESSAGE_LENGTH_CONSTRAINTS = MappingProxyType({
+    "max_message_length": 500
+})
+
+
+@pytest.fixture(scope="module")
+def enforcer(tmp_path_factory):
+    """Create one Enforcer for the module, writing output and logs to a temp dir."""
+    base_dir = tmp_path_factory.mktemp("enforce")
+    executor = Executor(data_dir="data", output_dir=str(base_dir / "output"))
+    logger = AuditLogger(log_dir=str(base_dir / "logs"))
+    return Enforcer(PolicyEngine("policy.json"), executor, logger)
 
 
 class TestConstraintApplication:
     """Test constraint validation and application."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.executor = Executor(data_dir="data", output_dir="output")
-        self.logger = AuditLogger(log_dir="logs")
-        self.enforcer = Enforcer(self.executor, self.logger)
+    @pytest.fixture(autouse=True)
+    def _use_make_intent(self, make_intent):
+        """Expose the shared intent factory to each test as self.make_intent."""
+        self.make_intent = make_intent
+    
+    def _intent(self, action, user_command, **parameters):
+        """Build an Intent for the given action, varying only the parameters."""
+        return self.make_intent(action=action, parameters=parameters, user_command=user_command)
     
-    def test_apply_constraints_with_no_constraints(self):
+    def test_apply_constraints_with_no_constraints(self, enforcer):
         """Test that intent is returned unchanged when no constraints."""
-        intent = Intent(
-            action="generate_report",
-            parameters={"location": "Delhi"},
-            timestamp=datetime.now(),
-            user_command="Generate report",
-            confidence=0.9
-        )
+        intent = self._intent("generate_report", "Generate report", location="Delhi")
         
-        result = self.enforcer.apply_constraints(intent, None)
+        result = enforcer.apply_constraints(intent, None)
         assert result == intent
         
-        result = self.enforcer.apply_constraints(intent, {})
+        result = enforcer.apply_constraints(intent, {})
         assert result == intent
     
-    def test_generate_report_format_constraint_valid(self):
+    def test_generate_report_format_constraint_valid(self, enforcer):
         """Test valid format constraint for generate_report."""
-        intent = Intent(
-            action="generate_report",
-            parameters={"location": "Delhi", "format": "txt"},
-            timestamp=datetime.now(),
-            user_command="Generate report",
-            confidence=0.9
-        )
+        intent = self._intent("generate_report", "Generate report", location="Delhi", format="txt")
         
-        constraints = {
-            "allowed_formats": ["txt", "json", "pdf"],
-            "max_file_size_mb": 10
-        }
-        
-        result = self.enforcer.apply_constraints(intent, constraints)
-        assert result.parameters["_policy_constraints"] == constraints
+        result = enforcer.apply_constraints(intent, _FORMAT_CONSTRAINTS)
+        assert result.parameters["_policy_constraints"] == _FORMAT_CONSTRAINTS
         assert result.parameters["_max_file_size_mb"] == 10
     
-    def test_generate_report_format_constraint_invalid(self):
+    def test_generate_report_format_constraint_invalid(self, enforcer):
         """Test invalid format constraint for generate_report."""
-        intent = Intent(
-            action="generate_report",
-            parameters={"location": "Delhi", "format": "exe"},
-            timestamp=datetime.now(),
-            user_command="Generate report",
-            confidence=0.9
-        )
+        intent = self._intent("generate_report", "Generate report", location="Delhi", format="exe")
         
+        # A list keeps the order of the allowed formats in the error message
         constraints = {
             "allowed_formats": ["txt", "json", "pdf"]
         }
         
-        with pytest.raises(ValueError) as exc_info:
-            self.enforcer.apply_constraints(intent, constraints)
-        
-        assert "Format 'exe' not allowed" in str(exc_info.value)
-        assert "txt, json, pdf" in str(exc_info.value)
+        with pytest.raises(ValueError, match=r"Format 'exe' not allowed.*txt, json, pdf"):
+            enforcer.apply_constraints(intent, constraints)
     
-    def test_analyze_aqi_metric_constraint_valid(self):
-        """Test valid metric constraint for analyze_aqi."""
-        intent = Intent(
-            action="analyze_aqi",
-            parameters={"location": "Delhi", "metrics": ["PM2.5", "PM10"]},
-            timestamp=datetime.now(),
-            user_command="Analyze AQI",
-            confidence=0.9
+    def test_allowed_values_built_once_per_policy_load(self, enforcer):
+        """Test that a rule's allowed-value lists are converted to sets at policy load."""
+        engine = enforcer.policy_engine
+        decision = engine.validate_intent(
+            self._intent("generate_report", "Generate report", location="Delhi")
         )
         
-        constraints = {
-            "allowed_metrics": ["PM2.5", "PM10", "NO2", "SO2", "CO", "O3"],
-            "max_data_points": 10000
-        }
+        allowed_values = engine.get_allowed_values(decision.rule_name)
+        allowed_formats = decision.constraints["allowed_formats"]
+        assert allowed_values["allowed_formats"] == frozenset(allowed_formats)
+        assert engine.get_allowed_values(decision.rule_name) is allowed_values
+    
+    def test_malformed_allowed_values_checked_directly(self, enforcer):
+        """Test that a non-list allowed-value constraint is checked as given."""
+        intent = self._intent("generate_report", "Generate report", location="Delhi", format="txt")
         
-        result = self.enforcer.apply_constraints(intent, constraints)
-        assert result.parameters["_policy_constraints"] == constraints
+        result = enforcer.apply_constraints(intent, {"allowed_formats": "txt"})
+        assert result.parameters["format"] == "txt"
+        
+        with pytest.raises(ValueError, match=r"Format 'txt' not allowed"):
+            enforcer.apply_constraints(intent, {"allowed_formats": "pdf"})
+    
+    def test_analyze_aqi_metric_constraint_valid(self, enforcer):
+        """Test valid metric constraint for analyze_aqi."""
+        intent = self._intent("analyze_aqi", "Analyze AQI", location="Delhi", metrics=["PM2.5", "PM10"])
+        
+        result = enforcer.apply_constraints(intent, _METRIC_CONSTRAINTS)
+        assert result.parameters["_policy_constraints"] == _METRIC_CONSTRAINTS
         assert result.parameters["_max_data_points"] == 10000
     
-    def test_analyze_aqi_metric_constraint_invalid(self):
+    def test_analyze_aqi_metric_constraint_invalid(self, enforcer):
         """Test invalid metric constraint for analyze_aqi."""
-        intent = Intent(
-            action="analyze_aqi",
-            parameters={"location": "Delhi", "metrics": ["INVALID_METRIC"]},
-            timestamp=datetime.now(),
-            user_command="Analyze AQI",
-            confidence=0.9
-        )
+        intent = self._intent("analyze_aqi", "Analyze AQI", location="Delhi", metrics=["INVALID_METRIC"])
         
-        constraints = {
-            "allowed_metrics": ["PM2.5", "PM10", "NO2"]
-        }
-        
-        with pytest.raises(ValueError) as exc_info:
-            self.enforcer.apply_constraints(intent, constraints)
-        
-        assert "Metric 'INVALID_METRIC' not allowed" in str(exc_info.value)
+        with pytest.raises(ValueError, match=r"Metric 'INVALID_METRIC' not allowed"):
+            enforcer.apply_constraints(intent, _METRIC_CONSTRAINTS)
     
-    def test_send_alert_severity_constraint_valid(self):
+    def test_send_alert_severity_constraint_valid(self, enforcer):
         """Test valid severity constraint for send_alert."""
-        intent = Intent(
-            action="send_alert",
-            parameters={
-                "severity": "warning",
-                "message": "High pollution detected",
-                "area": "Delhi"
-            },
-            timestamp=datetime.now(),
-            user_command="Send alert",
-            confidence=0.9
+        intent = self._intent(
+            "send_alert", "Send alert",
+            severity="warning", message="High pollution detected", area="Delhi"
         )
         
-        constraints = {
-            "allowed_severity_levels": ["info", "warning", "critical"],
-            "max_message_length": 500
-        }
-        
-        result = self.enforcer.apply_constraints(intent, constraints)
-        assert result.parameters["_policy_constraints"] == constraints
+        result = enforcer.apply_constraints(intent, _SEVERITY_CONSTRAINTS)
+        assert result.parameters["_policy_constraints"] == _SEVERITY_CONSTRAINTS
     
-    def test_send_alert_severity_constraint_invalid(self):
+    def test_send_alert_severity_constraint_invalid(self, enforcer):
         """Test invalid severity constraint for send_alert."""
-        intent = Intent(
-            action="send_alert",
-            parameters={
-                "severity": "extreme",
-                "message": "Test",
-                "area": "Delhi"
-            },
-            timestamp=datetime.now(),
-            user_command="Send alert",
-            confidence=0.9
+        intent = self._intent(
+            "send_alert", "Send alert",
+            severity="extreme", message="Test", area="Delhi"
         )
         
-        constraints = {
-            "allowed_severity_levels": ["info", "warning", "critical"]
-        }
-        
-        with pytest.raises(ValueError) as exc_info:
-            self.enforcer.apply_constraints(intent, constraints)
-        
-        assert "Severity level 'extreme' not allowed" in str(exc_info.value)
+        with pytest.raises(ValueError, match=r"Severity level 'extreme' not allowed"):
+            enforcer.apply_constraints(intent, _SEVERITY_CONSTRAINTS)
     
-    def test_send_alert_message_length_constraint_valid(self):
+    def test_send_alert_message_length_constraint_valid(self, enforcer):
         """Test valid message length constraint for send_alert."""
-        intent = Intent(
-            action="send_alert",
-            parameters={
-                "severity": "warning",
-                "message": "Short message",
-                "area": "Delhi"
-            },
-            timestamp=datetime.now(),
-            user_command="Send alert",
-            confidence=0.9
+        intent = self._intent(
+            "send_alert", "Send alert",
+            severity="warning", message="Short message", area="Delhi"
         )
         
-        constraints = {
-            "max_message_length": 500
-        }
-        
-        result = self.enforcer.apply_constraints(intent, constraints)
-        assert result.parameters["_policy_constraints"] == constraints
+        result = enforcer.apply_constraints(intent, _MESSAGE_LENGTH_CONSTRAINTS)
+        assert result.parameters["_policy_constraints"] == _MESSAGE_LENGTH_CONSTRAINTS
     
-    def test_send_alert_message_length_constraint_invalid(self):
+    def test_send_alert_message_length_constraint_invalid(self, enforcer):
         """Test invalid message length constraint for send_alert."""
         long_message = "x" * 501  # Exceeds 500 character limit
         
-        intent = Intent(
-            action="send_alert",
-            parameters={
-                "severity": "warning",
-                "message": long_message,
-                "area": "Delhi"
-            },
-            timestamp=datetime.now(),
-            user_command="Send alert",
-            confidence=0.9
+        intent = self._intent(
+            "send_alert", "Send alert",
+            severity="warning", message=long_message, area="Delhi"
         )
         
-        constraints = {
-            "max_message_length": 500
-        }
-        
-        with pytest.raises(ValueError) as exc_info:
-            self.enforcer.apply_constraints(intent, constraints)
-        
-        assert "exceeds maximum length of 500 characters" in str(exc_info.value)
-        assert "Current length: 501" in str(exc_info.value)
+        with pytest.raises(ValueError, match=r"exceeds maximum length of 500 characters.*Current length: 501"):
+            enforcer.apply_constraints(intent, _MESSAGE_LENGTH_CONSTRAINTS)
     
-    def test_enforce_and_execute_with_constraint_violation(self):
-        """Test that constraint violations are caught during enforcement."""
-        intent = Intent(
-            action="send_alert",
-            parameters={
-                "severity": "invalid_level",
-                "message": "Test",
-                "area": "Delhi"
-            },
-            timestamp=datetime.now(),
-            user_command="Send alert",
-            confidence=0.9
+    def test_send_alert_message_length_checked_first(self, enforcer):
+        """Test that the length check runs before the severity check."""
+        intent = self._intent(
+            "send_alert", "Send alert",
+            severity="extreme", message="x" * 501, area="Delhi"
         )
         
-        policy_decision = PolicyDecision(
-            allowed=True,
-            reason="Alert sending is permitted",
-            rule_name="send_alert",
-            constraints={
-                "allowed_severity_levels": ["info", "warning", "critical"]
-            }
+        with pytest.raises(ValueError, match=r"exceeds maximum length of 500 characters"):
+            enforcer.apply_constraints(intent, _SEVERITY_CONSTRAINTS)
+    
+    def test_enforce_and_execute_with_constraint_violation(self, enforcer):
+        """Test that constraint violations are caught during enforcement."""
+        intent = self._intent(
+            "send_alert", "Send alert",
+            severity="invalid_level", message="Test", area="Delhi"
         )
         
-        # The enforcer should catch the constraint violation
-        result = self.enforcer.enforce_and_execute(intent, policy_decision)
+        # The send_alert rule in policy.json restricts severity levels, so the
+        # enforcer should catch the constraint violation
+        result = enforcer.enforce_and_execute(intent)
         
         # Should return error result
-        assert result.success is False
-        assert "Severity level 'invalid_level' not allowed" in result.message
+        assert result["success"] is False
+        assert "Severity level 'invalid_level' not allowed" in result["message"]
 
 
 if __name__ == "__main__":
@@ -1,84 +1,53 @@
 """
-Test script for verifying tasks 6.3, 6.4, 6.5, and 6.6 implementation.
+Tests for verifying tasks 6.3, 6.4, 6.5, and 6.6 implementation.
 
-This script tests:
+This module tests:
 - Task 6.3: analyze_aqi() functionality
 - Task 6.4: generate_report() functionality with OpenClaw
 - Task 6.5: send_alert() functionality
 - Task 6.6: execute() method with action routing
+
+Run with ``pytest -q`` (or ``-v`` for per-test detail).
 """
 
 import os
-import sys
 from datetime import datetime
+from itertools import islice
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import pytest
 
 from executor import Executor
-from models import Intent
 
 
-def test_analyze_aqi():
+def test_analyze_aqi(delhi_analysis):
     """Test Task 6.3: AQI analysis functionality."""
-    print("\n" + "=" * 70)
-    print("TEST 6.3: Analyze AQI Functionality")
-    print("=" * 70)
+    # Analysis of the real data file (Delhi), shared across tests
+    analysis = delhi_analysis
+    summary = analysis['summary']
+    
+    assert analysis['location'] == "Delhi"
+    assert summary['average_aqi'] == pytest.approx(297.33)
+    assert summary['min_aqi'] == pytest.approx(287.0)
+    assert summary['max_aqi'] == pytest.approx(310.0)
+    assert summary['trend']
+    assert analysis['health_advisory']
     
-    executor = Executor()
+    # Verify all required metrics are present with consistent stats
+    for metric in ["PM2.5", "PM10", "NO2", "SO2", "CO"]:
+        stats = analysis['pollutants'][metric]
+        assert stats['min'] <= stats['avg'] <= stats['max']
     
-    try:
-        # Test with real data file (Delhi)
-        analysis = executor.analyze_aqi("Delhi")
-        
-        print(f"✓ Location: {analysis['location']}")
-        print(f"✓ Average AQI: {analysis['summary']['average_aqi']}")
-        print(f"✓ Min AQI: {analysis['summary']['min_aqi']}")
-        print(f"✓ Max AQI: {analysis['summary']['max_aqi']}")
-        print(f"✓ Trend: {analysis['summary']['trend']}")
-        print(f"✓ Health Advisory: {analysis['health_advisory']}")
-        
-        # Verify pollutant stats
-        if "PM2.5" in analysis['pollutants']:
-            pm25 = analysis['pollutants']['PM2.5']
-            print(f"✓ PM2.5 Average: {pm25['avg']} µg/m³")
-        
-        if "PM10" in analysis['pollutants']:
-            pm10 = analysis['pollutants']['PM10']
-            print(f"✓ PM10 Average: {pm10['avg']} µg/m³")
-        
-        if "NO2" in analysis['pollutants']:
-            no2 = analysis['pollutants']['NO2']
-            print(f"✓ NO2 Average: {no2['avg']} µg/m³")
-        
-        # Verify all required metrics are present
-        required_metrics = ["PM2.5", "PM10", "NO2", "SO2", "CO"]
-        for metric in required_metrics:
-            if metric in analysis['pollutants']:
-                print(f"✓ {metric} analysis included")
-        
-        print("\n✅ Task 6.3 PASSED: AQI analysis working correctly")
-        return True
-        
-    except Exception as e:
-        print(f"\n❌ Task 6.3 FAILED: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return False
+    assert analysis['pollutants']['PM2.5']['avg'] == pytest.approx(154.0)
+    assert analysis['pollutants']['PM10']['avg'] == pytest.approx(335.0)
+    assert analysis['pollutants']['NO2']['avg'] == pytest.approx(71.67)
 
 
-def test_generate_report():
+def test_generate_report(executor, frozen_ts):
     """Test Task 6.4: Report generation with OpenClaw."""
-    print("\n" + "=" * 70)
-    print("TEST 6.4: Generate Report Functionality (OpenClaw)")
-    print("=" * 70)
-    
-    executor = Executor()
-    
     # Create sample analysis data
     sample_analysis = {
         "location": "Delhi",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": frozen_ts.isoformat(),
         "summary": {
             "average_aqi": 287.5,
             "min_aqi": 278.0,
@@ -94,219 +63,168 @@ def test_generate_report():
         "health_advisory": "Very Unhealthy - Health alert, avoid outdoor activities"
     }
     
-    try:
-        result = executor.generate_report(sample_analysis, "Delhi")
-        
-        print(f"✓ Report file created: {result['report_file']}")
-        print(f"✓ Location: {result['location']}")
-        print(f"✓ Timestamp: {result['timestamp']}")
-        print(f"✓ Summary: {result['summary']}")
-        
-        # Verify file exists
-        if os.path.exists(result['report_file']):
-            print(f"✓ File verified to exist on disk")
-            
-            # Read and display first few lines
-            with open(result['report_file'], 'r') as f:
-                lines = f.readlines()[:10]
-                print("\n✓ Report preview (first 10 lines):")
-                for line in lines:
-                    print(f"  {line.rstrip()}")
-        else:
-            print(f"⚠ Warning: Report file not found at {result['report_file']}")
-        
-        print("\n✅ Task 6.4 PASSED: Report generation with OpenClaw working correctly")
-        return True
-        
-    except Exception as e:
-        print(f"\n❌ Task 6.4 FAILED: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-
-def test_send_alert():
-    """Test Task 6.5: Alert sending functionality."""
-    print("\n" + "=" * 70)
-    print("TEST 6.5: Send Alert Functionality")
-    print("=" * 70)
+    result = executor.generate_report(sample_analysis, "Delhi")
     
-    executor = Executor()
+    assert result['location'] == "Delhi"
+    assert result['timestamp']
+    assert result['summary']
     
-    try:
-        # Test critical alert
-        result = executor.send_alert(
-            severity="critical",
-            message="Extremely high pollution levels detected in Delhi",
-            area="Delhi",
-            pollutants={"PM2.5": 287, "PM10": 420, "NO2": 85}
-        )
-        
-        print(f"✓ Alert sent: {result['alert_sent']}")
-        print(f"✓ Alert ID: {result['alert_id']}")
-        print(f"✓ Severity: {result['severity']}")
-        print(f"✓ Area: {result['area']}")
-        print(f"✓ Recipients: {', '.join(result['recipients'])}")
-        
-        # Test warning alert
-        result2 = executor.send_alert(
-            severity="warning",
-            message="Elevated pollution levels",
-            area="Mumbai"
-        )
-        
-        print(f"\n✓ Second alert sent with severity: {result2['severity']}")
-        
-        # Test validation
-        try:
-            executor.send_alert(severity="invalid", message="test")
-            print("⚠ Warning: Invalid severity should have raised ValueError")
-        except ValueError as e:
-            print(f"✓ Validation working: {str(e)}")
-        
-        print("\n✅ Task 6.5 PASSED: Alert sending working correctly")
-        return True
-        
-    except Exception as e:
-        print(f"\n❌ Task 6.5 FAILED: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return False
+    # Verify the report file exists on disk and has the standard header
+    assert os.stat(result['report_file']).st_size > 0
+    with open(result['report_file'], 'r') as f:
+        lines = list(islice(f, 10))
+    assert "AIRGUARD AI - POLLUTION MONITORING REPORT" in lines[1]
 
 
-def test_execute_method():
+def test_send_alert(executor):
+    """Test Task 6.5: Alert sending functionality."""
+    # Test critical alert
+    result = executor.send_alert(
+        severity="critical",
+        message="Extremely high pollution levels detected in Delhi",
+        area="Delhi",
+        pollutants={"PM2.5": 287, "PM10": 420, "NO2": 85}
+    )
+    
+    assert result['alert_sent'] is True
+    assert result['alert_id'].startswith("ALERT-")
+    assert result['severity'] == "critical"
+    assert result['area'] == "Delhi"
+    assert len(result['recipients']) > 0
+    
+    # The displayed time matches the alert ID and the ISO timestamp
+    stamp = result['alert_id'][len("ALERT-"):]
+    sent_at = datetime.fromisoformat(result['timestamp'])
+    assert stamp == sent_at.strftime('%Y%m%d%H%M%S')
+    assert f"Timestamp: {sent_at.strftime('%Y-%m-%d %H:%M:%S')}" in result['formatted_alert']
+    
+    # Test warning alert
+    result2 = executor.send_alert(
+        severity="warning",
+        message="Elevated pollution levels",
+        area="Mumbai"
+    )
+    
+    assert result2['severity'] == "warning"
+    
+    # Test validation
+    with pytest.raises(ValueError, match=r"Invalid severity level 'invalid'"):
+        executor.send_alert(severity="invalid", message="test")
+
+
+def _check_routed_analysis(result):
+    """Verify analyze_aqi was routed and returned a summary."""
+    assert result.execution_time >= 0
+    assert "summary" in result.data
+
+
+def _check_routed_report(result):
+    """Verify generate_report was routed and created one file."""
+    assert len(result.files_created) == 1
+
+
+def _check_nothing(result):
+    """No checks beyond the success flag."""
+
+
+EXECUTE_CASES = [
+    pytest.param(
+        "analyze_aqi", {"location": "Delhi"}, "Analyze AQI in Delhi", 0.95,
+        True, _check_routed_analysis, id="analyze_aqi"
+    ),
+    pytest.param(
+        "generate_report", {"location": "Delhi"}, "Generate pollution report for Delhi", 0.95,
+        True, _check_routed_report, id="generate_report"
+    ),
+    pytest.param(
+        "send_alert",
+        {
+            "severity": "warning",
+            "message": "High pollution detected",
+            "area": "Delhi"
+        },
+        "Send alert about high pollution", 0.90,
+        True, _check_nothing, id="send_alert"
+    ),
+    # Error handling: unknown action
+    pytest.param(
+        "unknown_action", {}, "Do something unknown", 0.50,
+        False, _check_nothing, id="unknown-action"
+    ),
+    # Error handling: missing required location parameter
+    pytest.param(
+        "analyze_aqi", {}, "Analyze AQI", 0.80,
+        False, _check_nothing, id="missing-location"
+    ),
+]
+
+
+@pytest.mark.usefixtures("reuse_delhi_analysis")
+@pytest.mark.parametrize(
+    "action,parameters,user_command,confidence,expected_success,checker", EXECUTE_CASES
+)
+def test_execute_method(executor, make_intent, action, parameters, user_command, confidence,
+                        expected_success, checker):
     """Test Task 6.6: Main execute() method with action routing."""
-    print("\n" + "=" * 70)
-    print("TEST 6.6: Execute Method with Action Routing")
-    print("=" * 70)
-    
-    executor = Executor()
-    
-    try:
-        # Test 1: analyze_aqi action
-        print("\n--- Test 1: analyze_aqi action ---")
-        intent1 = Intent(
-            action="analyze_aqi",
-            parameters={"location": "Delhi"},
-            timestamp=datetime.now(),
-            user_command="Analyze AQI in Delhi",
-            confidence=0.95
-        )
-        
-        result1 = executor.execute(intent1)
-        print(f"✓ Success: {result1.success}")
-        print(f"✓ Message: {result1.message}")
-        print(f"✓ Execution time: {result1.execution_time:.3f}s")
-        print(f"✓ Data keys: {list(result1.data.keys()) if result1.data else 'None'}")
-        
-        # Test 2: generate_report action
-        print("\n--- Test 2: generate_report action ---")
-        intent2 = Intent(
-            action="generate_report",
-            parameters={"location": "Delhi"},
-            timestamp=datetime.now(),
-            user_command="Generate pollution report for Delhi",
-            confidence=0.95
-        )
-        
-        result2 = executor.execute(intent2)
-        print(f"✓ Success: {result2.success}")
-        print(f"✓ Message: {result2.message}")
-        print(f"✓ Execution time: {result2.execution_time:.3f}s")
-        print(f"✓ Files created: {result2.files_created}")
-        
-        # Test 3: send_alert action
-        print("\n--- Test 3: send_alert action ---")
-        intent3 = Intent(
-            action="send_alert",
-            parameters={
-                "severity": "warning",
-                "message": "High pollution detected",
-                "area": "Delhi"
-            },
-            timestamp=datetime.now(),
-            user_command="Send alert about high pollution",
-            confidence=0.90
-        )
-        
-        result3 = executor.execute(intent3)
-        print(f"✓ Success: {result3.success}")
-        print(f"✓ Message: {result3.message}")
-        print(f"✓ Execution time: {result3.execution_time:.3f}s")
-        
-        # Test 4: Unknown action (error handling)
-        print("\n--- Test 4: Unknown action (error handling) ---")
-        intent4 = Intent(
-            action="unknown_action",
-            parameters={},
-            timestamp=datetime.now(),
-            user_command="Do something unknown",
-            confidence=0.50
-        )
-        
-        result4 = executor.execute(intent4)
-        print(f"✓ Success: {result4.success} (should be False)")
-        print(f"✓ Message: {result4.message}")
-        
-        # Test 5: Missing required parameter (error handling)
-        print("\n--- Test 5: Missing parameter (error handling) ---")
-        intent5 = Intent(
-            action="analyze_aqi",
-            parameters={},  # Missing location
-            timestamp=datetime.now(),
-            user_command="Analyze AQI",
-            confidence=0.80
-        )
-        
-        result5 = executor.execute(intent5)
-        print(f"✓ Success: {result5.success} (should be False)")
-        print(f"✓ Message: {result5.message}")
-        
-        print("\n✅ Task 6.6 PASSED: Execute method with action routing working correctly")
-        return True
-        
-    except Exception as e:
-        print(f"\n❌ Task 6.6 FAILED: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-
-def main():
-    """Run all tests."""
-    print("\n" + "=" * 70)
-    print("EXECUTOR TASKS 6.3-6.6 VERIFICATION TEST SUITE")
-    print("=" * 70)
-    
-    results = []
-    
-    # Run all tests
-    results.append(("Task 6.3: analyze_aqi()", test_analyze_aqi()))
-    results.append(("Task 6.4: generate_report()", test_generate_report()))
-    results.append(("Task 6.5: send_alert()", test_send_alert()))
-    results.append(("Task 6.6: execute()", test_execute_method()))
-    
-    # Summary
-    print("\n" + "=" * 70)
-    print("TEST SUMMARY")
-    print("=" * 70)
-    
-    passed = sum(1 for _, result in results if result)
-    total = len(results)
-    
-    for test_name, result in results:
-        status = "✅ PASSED" if result else "❌ FAILED"
-        print(f"{status}: {test_name}")
-    
-    print(f"\nTotal: {passed}/{total} tests passed")
-    
-    if passed == total:
-        print("\n🎉 ALL TESTS PASSED! Tasks 6.3-6.6 are complete and working correctly.")
-        return 0
-    else:
-        print(f"\n⚠️  {total - passed} test(s) failed. Please review the errors above.")
-        return 1
-
-
-if __name__ == "__main__":
-    sys.exit(main())
+    intent = make_intent(
+        action=action,
+        parameters=parameters,
+        user_command=user_command,
+        confidence=confidence
+    )
+    
+    result = executor.execute(intent)
+    
+    assert result.success is expected_success, result.message
+    assert result.message
+    checker(result)
+
+
+def test_analyze_aqi_reuses_parsed_data(tmp_path, monkeypatch):
+    """Test that repeated analyses parse the data file once until it changes."""
+    data_file = tmp_path / "delhi_pollution.json"
+    data_file.write_text(open(os.path.join("data", "delhi_pollution.json")).read())
+    executor = Executor(data_dir=str(tmp_path), output_dir=str(tmp_path / "output"))
+    
+    reads = []
+    original_read_file = executor.pc.read_file
+    
+    def read_file(path):
+        reads.append(path)
+        return original_read_file(path)
+    
+    monkeypatch.setattr(executor.pc, "read_file", read_file)
+    
+    first = executor.analyze_aqi("Delhi")
+    second = executor.analyze_aqi("Delhi")
+    assert len(reads) == 1
+    assert second['summary'] == first['summary']
+    
+    # A modified data file is read again
+    stat = data_file.stat()
+    os.utime(data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    executor.analyze_aqi("Delhi")
+    assert len(reads) == 2
+
+
+def test_analyze_aqi_data_cache_is_bounded(tmp_path, monkeypatch):
+    """Test that the data cache is keyed on the requested location and bounded."""
+    contents = open(os.path.join("data", "delhi_pollution.json")).read()
+    for name in ("delhi", "new_delhi"):
+        (tmp_path / f"{name}_pollution.json").write_text(contents)
+    (tmp_path / "pune_pollution.csv").write_text(
+        open(os.path.join("data", "mumbai_pollution.csv")).read()
+    )
+    executor = Executor(data_dir=str(tmp_path), output_dir=str(tmp_path / "output"))
+    
+    executor.analyze_aqi("Delhi")
+    executor.analyze_aqi("Delhi")
+    assert list(executor._data_cache) == ["Delhi"]
+    
+    # CSV data records the caller's spelling, so each spelling gets its own entry
+    assert executor.analyze_aqi("pune")['location'] == "pune"
+    assert executor.analyze_aqi("PUNE")['location'] == "PUNE"
+    
+    monkeypatch.setattr("executor._DATA_CACHE_SIZE", 1)
+    executor.analyze_aqi("New Delhi")
+    assert list(executor._data_cache) == ["New Delhi"]
@@ -8,6 +8,7 @@ Tests the audit logging functionality including:
 """
 
 import pytest
+import itertools
 import json
 import os
 from datetime import datetime, timedelta
@@ -17,6 +18,38 @@ from logger import AuditLogger
 from models import Intent, PolicyDecision, ExecutionResult
 
 
+# Audit log lines with a corrupted line between two valid entries
+_CORRUPT_LINES = (
+    b'{"timestamp": "2024-01-01T12:00:00", "status": "SUCCESS", "intent": null, "policy_decision": null, "result": null}',
+    b'this is not valid json',
+    b'{"timestamp": "2024-01-01T12:01:00", "status": "BLOCKED", "intent": null, "policy_decision": null, "result": null}'
+)
+
+
+# Start of the frozen test clock
+_T0 = datetime(2024, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture(autouse=True)
+def frozen_clock(monkeypatch):
+    """
+    Freeze the logger's clock at _T0.
+    
+    Each datetime.now() call in the logger returns _T0 plus one more
+    microsecond, so entries stay strictly ordered without reading the
+    system clock. Returns _T0.
+    """
+    ticks = itertools.count()
+    
+    class FrozenDateTime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return _T0 + timedelta(microseconds=next(ticks))
+    
+    monkeypatch.setattr("logger.datetime", FrozenDateTime)
+    return _T0
+
+
 @pytest.fixture
 def temp_log_dir(tmp_path):
     """Create a temporary log directory for testing."""
@@ -31,19 +64,21 @@ def logger(temp_log_dir):
     return AuditLogger(log_dir=temp_log_dir)
 
 
-@pytest.fixture
+# The sample objects below are shared by every test in the session. Tests
+# only log them and never mutate them; use dataclasses.replace() to vary one.
+@pytest.fixture(scope="session")
 def sample_intent():
     """Create a sample intent for testing."""
     return Intent(
         action="generate_report",
         parameters={"location": "Delhi"},
-        timestamp=datetime.now(),
+        timestamp=_T0,
         user_command="Generate pollution report for Delhi",
         confidence=0.95
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_policy_decision():
     """Create a sample policy decision for testing."""
     return PolicyDecision(
@@ -54,7 +89,7 @@ def sample_policy_decision():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_execution_result():
     """Create a sample execution result for testing."""
     return ExecutionResult(
@@ -66,6 +101,20 @@ def sample_execution_result():
     )
 
 
+@pytest.fixture(scope="session")
+def sample_entry_bytes(sample_intent, sample_policy_decision, sample_execution_result):
+    """Serialize one SUCCESS log line for the sample action, once per session."""
+    entry = AuditLogger._build_entry(
+        sample_intent, sample_policy_decision, sample_execution_result, "SUCCESS"
+    )
+    return json.dumps(entry).encode() + b"\n"
+
+
+def _write_identical_entries(logger, entry_bytes, n):
+    """Replace the log with n copies of one serialized entry."""
+    logger.log_file.write_bytes(entry_bytes * n)
+
+
 def test_logger_initialization(temp_log_dir):
     """Test that logger initializes and creates log directory."""
     logger = AuditLogger(log_dir=temp_log_dir)
@@ -98,7 +147,7 @@ def test_log_blocked_action(logger, sample_intent):
     blocked_intent = Intent(
         action="shutdown_factory",
         parameters={"factory_id": "F123"},
-        timestamp=datetime.now(),
+        timestamp=_T0,
         user_command="Shutdown factory in Mayapuri",
         confidence=0.90
     )
@@ -138,9 +187,11 @@ def test_log_error(logger):
 
 def test_get_logs_all(logger, sample_intent, sample_policy_decision, sample_execution_result):
     """Test retrieving all logs."""
-    # Log multiple actions
-    logger.log_action(sample_intent, sample_policy_decision, sample_execution_result, "SUCCESS")
-    logger.log_action(sample_intent, sample_policy_decision, sample_execution_result, "SUCCESS")
+    # Log multiple actions in one batch
+    logger.log_action_many([
+        (sample_intent, sample_policy_decision, sample_execution_result, "SUCCESS"),
+        (sample_intent, sample_policy_decision, sample_execution_result, "SUCCESS")
+    ])
     
     logs = logger.get_logs()
     
@@ -172,9 +223,22 @@ def test_get_logs_with_status_filter(logger, sample_intent, sample_policy_decisi
     assert len(error_logs) == 1
 
 
-def test_get_logs_with_time_filter(logger, sample_intent, sample_policy_decision, sample_execution_result):
+def test_get_logs_status_filter_exact_match(logger, seed_log):
+    """Test that the status pre-filter never replaces the exact status check."""
+    seed_log(logger.log_file, raw_lines=[
+        b'{"timestamp": "2024-01-01T12:00:00", "status": "ERROR", "intent": null, '
+        b'"policy_decision": {"reason": "SUCCESS"}, "result": null}',
+        b'{"status":"SUCCESS","timestamp":"2024-01-01T12:01:00"}'
+    ])
+    
+    logs = logger.get_logs(status_filter="SUCCESS")
+    assert [log["timestamp"] for log in logs] == ["2024-01-01T12:01:00"]
+
+
+def test_get_logs_with_time_filter(logger, frozen_clock, sample_intent, sample_policy_decision,
+                                   sample_execution_result):
     """Test retrieving logs filtered by time range."""
-    now = datetime.now()
+    now = frozen_clock
     
     # Log an action
     logger.log_action(sample_intent, sample_policy_decision, sample_execution_result, "SUCCESS")
@@ -185,6 +249,7 @@ def test_get_logs_with_time_filter(logger, sample_intent, sample_policy_decision
     
     logs = logger.get_logs(start_time=start_time, end_time=end_time)
     assert len(logs) == 1
+    assert logs[0]["timestamp"] == now.isoformat()
     
     # Filter with future start time (should return empty)
     future_start = now + timedelta(hours=1)
@@ -198,24 +263,47 @@ def test_get_logs_empty_file(logger):
     assert logs == []
 
 
-def test_get_logs_corrupted_entry(logger, temp_log_dir):
+def test_get_logs_empty_existing_file(logger, seed_log):
+    """Test retrieving logs when the log file exists but is empty."""
+    seed_log(logger.log_file, raw_lines=[])
+    
+    assert logger.get_logs() == []
+
+
+def test_get_logs_last_line_without_newline(logger):
+    """Test that a final entry without a trailing newline is still read."""
+    logger.log_file.write_bytes(b"\n".join(_CORRUPT_LINES))
+    
+    logs = logger.get_logs()
+    assert [log["status"] for log in logs] == ["SUCCESS", "BLOCKED"]
+
+
+def test_get_logs_corrupted_entry(logger, seed_log):
     """Test handling of corrupted log entries."""
-    # Write a corrupted log entry
-    with open(logger.log_file, "w") as f:
-        f.write('{"timestamp": "2024-01-01T12:00:00", "status": "SUCCESS", "intent": null, "policy_decision": null, "result": null}\n')
-        f.write('this is not valid json\n')
-        f.write('{"timestamp": "2024-01-01T12:01:00", "status": "BLOCKED", "intent": null, "policy_decision": null, "result": null}\n')
+    # Write a log with a corrupted entry between two valid ones
+    seed_log(logger.log_file, raw_lines=_CORRUPT_LINES)
     
     # Should skip corrupted entry and return valid ones
     logs = logger.get_logs()
     assert len(logs) == 2
 
 
-def test_multiple_log_entries(logger, sample_intent, sample_policy_decision, sample_execution_result):
+def test_get_logs_reads_entries_orjson_rejects(logger, seed_log):
+    """Test that entries the stdlib json accepts are still read back."""
+    seed_log(logger.log_file, raw_lines=[
+        b'{"timestamp": "2024-01-01T12:00:00", "status": "SUCCESS", '
+        b'"intent": null, "policy_decision": null, "result": {"value": NaN}}'
+    ])
+    
+    logs = logger.get_logs()
+    assert len(logs) == 1
+    assert logs[0]["result"]["value"] != logs[0]["result"]["value"]  # NaN
+
+
+def test_multiple_log_entries(logger, sample_entry_bytes):
     """Test logging multiple actions and retrieving them."""
-    # Log 5 actions
-    for i in range(5):
-        logger.log_action(sample_intent, sample_policy_decision, sample_execution_result, "SUCCESS")
+    # Populate the log with 5 actions
+    _write_identical_entries(logger, sample_entry_bytes, 5)
     
     logs = logger.get_logs()
     assert len(logs) == 5
@@ -227,15 +315,36 @@ def test_multiple_log_entries(logger, sample_intent, sample_policy_decision, sam
         assert "intent" in log
 
 
+def test_log_action_many_matches_log_action(logger, sample_intent, sample_policy_decision,
+                                            sample_execution_result):
+    """Test that batch logging writes the same entries as single logging."""
+    logger.log_action(sample_intent, sample_policy_decision, sample_execution_result, "SUCCESS")
+    logger.log_action_many([
+        (sample_intent, sample_policy_decision, sample_execution_result, "SUCCESS"),
+        (None, None, None, "ERROR")
+    ])
+    logger.log_action_many([])
+    
+    logs = logger.get_logs()
+    assert [log["status"] for log in logs] == ["SUCCESS", "SUCCESS", "ERROR"]
+    
+    # Apart from the timestamp, batched entries are identical to single ones
+    for log in logs:
+        del log["timestamp"]
+    assert logs[0] == logs[1]
+
+
 def test_log_append_mode(logger, sample_intent, sample_policy_decision, sample_execution_result):
     """Test that logs are appended, not overwritten."""
     # Log first action
     logger.log_action(sample_intent, sample_policy_decision, sample_execution_result, "SUCCESS")
-    logs = logger.get_logs()
-    assert len(logs) == 1
+    first_size = logger.log_file.stat().st_size
+    assert first_size > 0
     
     # Log second action
     logger.log_action(sample_intent, sample_policy_decision, sample_execution_result, "SUCCESS")
+    assert logger.log_file.stat().st_size > first_size
+    
     logs = logger.get_logs()
     assert len(logs) == 2  # Should have both entries
 
@@ -4,20 +4,21 @@ Unit tests for core data models.
 Tests validation logic and serialization for Intent, PolicyDecision, and ExecutionResult.
 """
 
+import copy
 import pytest
-from datetime import datetime
+from dataclasses import FrozenInstanceError, replace
 from models import Intent, PolicyDecision, ExecutionResult
 
 
 class TestIntent:
     """Test cases for Intent dataclass."""
     
-    def test_valid_intent_creation(self):
+    def test_valid_intent_creation(self, frozen_ts):
         """Test creating a valid intent."""
         intent = Intent(
             action="generate_report",
             parameters={"location": "Delhi"},
-            timestamp=datetime.now(),
+            timestamp=frozen_ts,
             user_command="Generate pollution report for Delhi",
             confidence=0.95
         )
@@ -25,43 +26,62 @@ class TestIntent:
         assert intent.parameters == {"location": "Delhi"}
         assert intent.confidence == 0.95
     
-    def test_intent_validation_empty_action(self):
+    def test_intent_validation_empty_action(self, frozen_ts):
         """Test that empty action raises ValueError."""
         with pytest.raises(ValueError, match="action must be a non-empty string"):
             Intent(
                 action="",
                 parameters={},
-                timestamp=datetime.now(),
+                timestamp=frozen_ts,
                 user_command="test",
                 confidence=0.5
             )
     
-    def test_intent_validation_invalid_confidence(self):
+    def test_intent_validation_invalid_confidence(self, frozen_ts):
         """Test that confidence outside 0-1 range raises ValueError."""
         with pytest.raises(ValueError, match="confidence must be a float between 0.0 and 1.0"):
             Intent(
                 action="test",
                 parameters={},
-                timestamp=datetime.now(),
+                timestamp=frozen_ts,
                 user_command="test",
                 confidence=1.5
             )
     
-    def test_intent_to_dict(self):
+    def test_intent_to_dict(self, frozen_ts):
         """Test intent serialization to dictionary."""
-        now = datetime.now()
         intent = Intent(
             action="analyze_aqi",
             parameters={"location": "Mumbai"},
-            timestamp=now,
+            timestamp=frozen_ts,
             user_command="Analyze AQI in Mumbai",
             confidence=0.85
         )
         result = intent.to_dict()
         assert result["action"] == "analyze_aqi"
         assert result["parameters"] == {"location": "Mumbai"}
-        assert result["timestamp"] == now.isoformat()
+        assert result["timestamp"] == frozen_ts.isoformat()
         assert result["confidence"] == 0.85
+        # Nested values are shared with the intent, not deep-copied
+        assert result["parameters"] is intent.parameters
+    
+    def test_intent_is_immutable(self, frozen_ts):
+        """Test that intent fields can't be reassigned and instances carry no __dict__."""
+        intent = Intent(
+            action="analyze_aqi",
+            parameters={"location": "Mumbai"},
+            timestamp=frozen_ts,
+            user_command="Analyze AQI in Mumbai",
+            confidence=0.85
+        )
+        with pytest.raises(FrozenInstanceError):
+            intent.action = "send_alert"
+        assert not hasattr(intent, "__dict__")
+        
+        changed = replace(intent, action="send_alert")
+        assert changed.action == "send_alert"
+        assert intent.action == "analyze_aqi"
+        assert copy.deepcopy(intent) == intent
 
 
 class TestPolicyDecision:
@@ -153,6 +173,9 @@ class TestExecutionResult:
         assert result_dict["data"] == {"aqi": 287}
         assert result_dict["execution_time"] == 0.5
         assert result_dict["files_created"] == []
+        # Nested values are shared with the result, not deep-copied
+        assert result_dict["data"] is result.data
+        assert result_dict["files_created"] is result.files_created
 
 
 if __name__ == "__main__":
@@ -7,136 +7,70 @@ Tests the policy validation, rule matching, and error handling.
 import pytest
 import json
 import os
-from datetime import datetime
 from policy import PolicyEngine
-from models import Intent, PolicyDecision
+
+
+# action, allowed, rule name, reason substrings (any may match) and a
+# constraint key the decision must carry (None: no constraints)
+_VALIDATE_CASES = [
+    pytest.param(
+        "generate_report", True, "generate_report", ("read-only",), "max_file_size_mb",
+        id="generate_report"
+    ),
+    pytest.param(
+        "analyze_aqi", True, "analyze_aqi", ("read-only",), "max_data_points",
+        id="analyze_aqi"
+    ),
+    pytest.param(
+        "send_alert", True, "send_alert", ("public safety",), "max_message_length",
+        id="send_alert"
+    ),
+    pytest.param(
+        "shutdown_factory", False, "shutdown_factory", ("human authorization",), None,
+        id="shutdown_factory"
+    ),
+    pytest.param(
+        "issue_fine", False, "issue_fine", ("legal", "authorization"), None,
+        id="issue_fine"
+    ),
+    pytest.param(
+        "unknown_action", False, "default", ("not explicitly allowed",), None,
+        id="unknown-action"
+    ),
+]
 
 
 class TestPolicyEngine:
     """Test suite for PolicyEngine class."""
     
-    def test_init_loads_policy_file(self):
+    def test_init_loads_policy_file(self, policy_engine):
         """Test that PolicyEngine loads policy.json on initialization."""
-        engine = PolicyEngine("policy.json")
+        engine = policy_engine
         
         assert engine.policy_data is not None
         assert len(engine.rules) > 0
         assert engine.default_policy == "deny"
     
-    def test_validate_allowed_action_generate_report(self):
-        """Test that generate_report action is allowed."""
-        engine = PolicyEngine("policy.json")
-        
-        intent = Intent(
-            action="generate_report",
-            parameters={"location": "Delhi"},
-            timestamp=datetime.now(),
-            user_command="Generate pollution report for Delhi",
-            confidence=0.95
-        )
-        
-        decision = engine.validate_intent(intent)
-        
-        assert decision.allowed is True
-        assert decision.rule_name == "generate_report"
-        assert "read-only" in decision.reason.lower()
-        assert decision.constraints is not None
-        assert "max_file_size_mb" in decision.constraints
-    
-    def test_validate_allowed_action_analyze_aqi(self):
-        """Test that analyze_aqi action is allowed."""
-        engine = PolicyEngine("policy.json")
-        
-        intent = Intent(
-            action="analyze_aqi",
-            parameters={"location": "Delhi"},
-            timestamp=datetime.now(),
-            user_command="Analyze AQI in Delhi",
-            confidence=0.9
-        )
-        
-        decision = engine.validate_intent(intent)
-        
-        assert decision.allowed is True
-        assert decision.rule_name == "analyze_aqi"
-        assert decision.constraints is not None
-    
-    def test_validate_allowed_action_send_alert(self):
-        """Test that send_alert action is allowed."""
-        engine = PolicyEngine("policy.json")
-        
-        intent = Intent(
-            action="send_alert",
-            parameters={"severity": "critical", "message": "High pollution"},
-            timestamp=datetime.now(),
-            user_command="Send alert about high pollution",
-            confidence=0.85
-        )
-        
-        decision = engine.validate_intent(intent)
-        
-        assert decision.allowed is True
-        assert decision.rule_name == "send_alert"
-        assert "public safety" in decision.reason.lower()
-    
-    def test_validate_blocked_action_shutdown_factory(self):
-        """Test that shutdown_factory action is blocked."""
-        engine = PolicyEngine("policy.json")
-        
-        intent = Intent(
-            action="shutdown_factory",
-            parameters={"factory_id": "F123", "location": "Mayapuri"},
-            timestamp=datetime.now(),
-            user_command="Shutdown factory in Mayapuri",
-            confidence=0.92
-        )
-        
-        decision = engine.validate_intent(intent)
-        
-        assert decision.allowed is False
-        assert decision.rule_name == "shutdown_factory"
-        assert "human authorization" in decision.reason.lower()
-        assert decision.constraints is None
-    
-    def test_validate_blocked_action_issue_fine(self):
-        """Test that issue_fine action is blocked."""
-        engine = PolicyEngine("policy.json")
-        
-        intent = Intent(
-            action="issue_fine",
-            parameters={"factory_id": "F456", "amount": 50000},
-            timestamp=datetime.now(),
-            user_command="Issue fine to polluting factory",
-            confidence=0.88
-        )
-        
-        decision = engine.validate_intent(intent)
-        
-        assert decision.allowed is False
-        assert decision.rule_name == "issue_fine"
-        assert "legal" in decision.reason.lower() or "authorization" in decision.reason.lower()
-    
-    def test_validate_unknown_action_uses_default_policy(self):
-        """Test that unknown actions use default deny policy."""
-        engine = PolicyEngine("policy.json")
-        
-        intent = Intent(
-            action="unknown_action",
-            parameters={},
-            timestamp=datetime.now(),
-            user_command="Do something unknown",
-            confidence=0.5
-        )
-        
-        decision = engine.validate_intent(intent)
-        
-        assert decision.allowed is False
-        assert decision.rule_name == "default"
-        assert "not explicitly allowed" in decision.reason.lower()
+    @pytest.mark.parametrize(
+        "action,allowed,rule_name,reason_subs,constraint_key", _VALIDATE_CASES
+    )
+    def test_validate_intent(self, policy_engine, intents, action, allowed, rule_name,
+                             reason_subs, constraint_key):
+        """Test the decision, matched rule, reason and constraints for each action."""
+        decision = policy_engine.validate_intent(intents[action])
+        
+        assert decision.allowed is allowed
+        assert decision.rule_name == rule_name
+        reason_lc = decision.reason.lower()
+        assert any(sub in reason_lc for sub in reason_subs)
+        if constraint_key is None:
+            assert decision.constraints is None
+        else:
+            assert constraint_key in decision.constraints
     
-    def test_get_allowed_actions(self):
+    def test_get_allowed_actions(self, policy_engine):
         """Test that get_allowed_actions returns correct list."""
-        engine = PolicyEngine("policy.json")
+        engine = policy_engine
         
         allowed = engine.get_allowed_actions()
         
@@ -147,9 +81,9 @@ class TestPolicyEngine:
         assert "shutdown_factory" not in allowed
         assert "issue_fine" not in allowed
     
-    def test_get_policy_info(self):
+    def test_get_policy_info(self, policy_engine):
         """Test that get_policy_info returns metadata."""
-        engine = PolicyEngine("policy.json")
+        engine = policy_engine
         
         info = engine.get_policy_info()
         
@@ -160,17 +94,11 @@ class TestPolicyEngine:
         assert info["default_policy"] == "deny"
         assert info["rules_count"] > 0
     
-    def test_policy_decision_structure(self):
+    def test_policy_decision_structure(self, policy_engine, intents):
         """Test that PolicyDecision has correct structure."""
-        engine = PolicyEngine("policy.json")
+        engine = policy_engine
         
-        intent = Intent(
-            action="generate_report",
-            parameters={},
-            timestamp=datetime.now(),
-            user_command="Generate report",
-            confidence=0.9
-        )
+        intent = intents["generate_report"]
         
         decision = engine.validate_intent(intent)
         
@@ -186,31 +114,17 @@ class TestPolicyEngine:
         assert isinstance(decision.rule_name, str)
         assert decision.constraints is None or isinstance(decision.constraints, dict)
     
-    def test_constraints_for_allowed_actions(self):
+    def test_constraints_for_allowed_actions(self, policy_engine, intents):
         """Test that allowed actions have appropriate constraints."""
-        engine = PolicyEngine("policy.json")
+        engine = policy_engine
         
         # Test generate_report constraints
-        intent = Intent(
-            action="generate_report",
-            parameters={},
-            timestamp=datetime.now(),
-            user_command="Generate report",
-            confidence=0.9
-        )
-        decision = engine.validate_intent(intent)
+        decision = engine.validate_intent(intents["generate_report"])
         assert decision.constraints is not None
         assert "max_file_size_mb" in decision.constraints
         
         # Test analyze_aqi constraints
-        intent = Intent(
-            action="analyze_aqi",
-            parameters={},
-            timestamp=datetime.now(),
-            user_command="Analyze AQI",
-            confidence=0.9
-        )
-        decision = engine.validate_intent(intent)
+        decision = engine.validate_intent(intents["analyze_aqi"])
         assert decision.constraints is not None
         assert "max_data_points" in decision.constraints
     
@@ -221,9 +135,9 @@ class TestPolicyEngine:
         
         assert "not found" in str(exc_info.value).lower()
     
-    def test_reload_policy_success(self):
+    def test_reload_policy_success(self, fresh_engine):
         """Test that reload_policy successfully reloads the policy."""
-        engine = PolicyEngine("policy.json")
+        engine = fresh_engine
         
         initial_rules_count = len(engine.rules)
         
@@ -233,9 +147,24 @@ class TestPolicyEngine:
         assert success is True
         assert len(engine.rules) == initial_rules_count
     
-    def test_reload_policy_with_missing_file(self):
+    def test_reload_policy_from_parsed_data(self, fresh_engine):
+        """Test that reload_policy accepts already-parsed policy data."""
+        engine = fresh_engine
+        policy_data = engine.policy_data
+        
+        # The file is not read when the data is passed in
+        engine.policy_file = "nonexistent.json"
+        
+        assert engine.reload_policy(policy_data=policy_data) is True
+        assert engine.rules == policy_data["rules"]
+        
+        # Parsed data is validated like the file contents
+        assert engine.reload_policy(policy_data={"version": "2.0"}) is False
+        assert engine.rules == policy_data["rules"]
+    
+    def test_reload_policy_with_missing_file(self, fresh_engine):
         """Test that reload_policy handles missing file gracefully."""
-        engine = PolicyEngine("policy.json")
+        engine = fresh_engine
         
         # Change to nonexistent file
         engine.policy_file = "nonexistent.json"
@@ -246,36 +175,71 @@ class TestPolicyEngine:
         assert success is False
         # Original policy should still be intact
         assert len(engine.rules) > 0
+    
+    def test_fresh_engine_is_independent(self, policy_engine, fresh_engine):
+        """Test that reloading a fresh engine leaves the shared engine alone."""
+        fresh_engine.policy_file = "nonexistent.json"
+        fresh_engine.reload_policy(policy_data={
+            "rules": [{"action": "analyze_aqi", "allowed": True, "reason": "Read-only"}]
+        })
+        
+        assert fresh_engine.get_allowed_actions() == ["analyze_aqi"]
+        assert policy_engine.policy_file == "policy.json"
+        assert "generate_report" in policy_engine.get_allowed_actions()
+    
+    def test_reload_policy_refreshes_cached_views(self, tmp_path):
+        """Test that allowed actions and policy info are recomputed on reload."""
+        policy_file = tmp_path / "policy.json"
+        policy_file.write_text(json.dumps({
+            "rules": [{"action": "analyze_aqi", "allowed": True, "reason": "Read-only"}]
+        }))
+        engine = PolicyEngine(str(policy_file))
+        
+        assert engine.get_allowed_actions() == ["analyze_aqi"]
+        
+        # Each call returns its own copy of the cached metadata
+        info = engine.get_policy_info()
+        info["allowed_actions"].append("shutdown_factory")
+        info["rules_count"] = 0
+        assert engine.get_policy_info()["allowed_actions"] == ["analyze_aqi"]
+        assert engine.get_policy_info()["rules_count"] == 1
+        
+        policy_file.write_text(json.dumps({
+            "rules": [
+                {"action": "analyze_aqi", "allowed": True, "reason": "Read-only"},
+                {"action": "send_alert", "allowed": True, "reason": "Public safety"}
+            ]
+        }))
+        assert engine.reload_policy() is True
+        
+        assert engine.get_allowed_actions() == ["analyze_aqi", "send_alert"]
+        assert engine.get_policy_info()["rules_count"] == 2
+    
+    def test_failed_reload_keeps_current_policy(self, tmp_path):
+        """Test that a rejected policy leaves the loaded configuration in place."""
+        policy_file = tmp_path / "policy.json"
+        policy_file.write_text(json.dumps({
+            "rules": [{"action": "analyze_aqi", "allowed": True, "reason": "Read-only"}]
+        }))
+        engine = PolicyEngine(str(policy_file))
+        policy_data = engine.policy_data
+        
+        rejected = {"rules": [{"action": "send_alert", "allowed": True}]}
+        assert engine.reload_policy(rejected) is False
+        
+        assert engine.policy_data is policy_data
+        assert engine.rules == policy_data["rules"]
+        assert engine.get_policy_info()["rules_count"] == 1
 
 
 class TestPolicyEngineEdgeCases:
     """Test edge cases and error handling."""
     
-    def test_empty_action_name(self):
-        """Test validation with empty action name."""
-        engine = PolicyEngine("policy.json")
-        
-        # Create intent with empty action (should fail validation in Intent class)
-        with pytest.raises(ValueError):
-            Intent(
-                action="",
-                parameters={},
-                timestamp=datetime.now(),
-                user_command="Test",
-                confidence=0.5
-            )
-    
-    def test_multiple_validations_same_intent(self):
+    def test_multiple_validations_same_intent(self, policy_engine, intents):
         """Test that validating same intent multiple times gives same result."""
-        engine = PolicyEngine("policy.json")
+        engine = policy_engine
         
-        intent = Intent(
-            action="generate_report",
-            parameters={},
-            timestamp=datetime.now(),
-            user_command="Generate report",
-            confidence=0.9
-        )
+        intent = intents["generate_report"]
         
         decision1 = engine.validate_intent(intent)
         decision2 = engine.validate_intent(intent)
@@ -283,19 +247,30 @@ class TestPolicyEngineEdgeCases:
         assert decision1.allowed == decision2.allowed
         assert decision1.reason == decision2.reason
         assert decision1.rule_name == decision2.rule_name
+        assert decision1 is decision2
+    
+    def test_first_matching_rule_wins(self, tmp_path, make_intent):
+        """Test that the first rule for an action decides when rules repeat."""
+        policy_file = tmp_path / "policy.json"
+        policy_file.write_text(json.dumps({
+            "rules": [
+                {"action": "generate_report", "allowed": True, "reason": "First rule"},
+                {"action": "generate_report", "allowed": False, "reason": "Second rule"}
+            ]
+        }))
+        engine = PolicyEngine(str(policy_file))
+        
+        decision = engine.validate_intent(make_intent(action="generate_report"))
+        
+        assert decision.allowed is True
+        assert decision.reason == "First rule"
     
-    def test_case_sensitive_action_matching(self):
+    def test_case_sensitive_action_matching(self, policy_engine, make_intent):
         """Test that action matching is case-sensitive."""
-        engine = PolicyEngine("policy.json")
+        engine = policy_engine
         
         # Uppercase action should not match
-        intent = Intent(
-            action="GENERATE_REPORT",
-            parameters={},
-            timestamp=datetime.now(),
-            user_command="Generate report",
-            confidence=0.9
-        )
+        intent = make_intent(action="GENERATE_REPORT", user_command="Generate report")
         
         decision = engine.validate_intent(intent)
         
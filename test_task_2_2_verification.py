@@ -10,22 +10,32 @@ This test file verifies that the validate_intent_structure() method:
 Requirements mapped: 1.4
 """
 
-import sys
-sys.path.insert(0, '.')
-
 import pytest
 from datetime import datetime
 from intent import IntentParser
 from models import Intent
 
 
+# Commands for every supported action; each parses to a valid intent
+_VALID_COMMANDS = (
+    "Generate pollution report for Delhi",
+    "Analyze AQI in Mumbai",
+    "Send critical alert about pollution",
+    "Shutdown factory in Mayapuri",
+    "Issue fine to polluting factory"
+)
+
+
+@pytest.fixture(scope="class")
+def _class_parser(request):
+    """Create one IntentParser per test class; parsing does not mutate it."""
+    request.cls.parser = IntentParser()
+
+
+@pytest.mark.usefixtures("_class_parser")
 class TestTask22Verification:
     """Verification tests for Task 2.2 requirements."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.parser = IntentParser()
-    
     # Requirement 1: Method exists
     def test_validate_intent_structure_method_exists(self):
         """Verify that validate_intent_structure() method exists."""
@@ -113,26 +123,30 @@ class TestTask22Verification:
         assert self.parser.validate_intent_structure(intent_special) is True
     
     # Requirement 4: Returns True for valid intents
-    def test_returns_true_for_valid_intents(self):
+    @pytest.mark.parametrize("command", _VALID_COMMANDS)
+    def test_returns_true_for_valid_intents(self, command):
         """Verify that method returns True for valid intents."""
-        valid_commands = [
-            "Generate pollution report for Delhi",
-            "Analyze AQI in Mumbai",
-            "Send critical alert about pollution",
-            "Shutdown factory in Mayapuri",
-            "Issue fine to polluting factory"
-        ]
+        intent = self.parser.parse_intent(command)
         
-        for command in valid_commands:
-            intent = self.parser.parse_intent(command)
-            assert self.parser.validate_intent_structure(intent) is True, \
-                f"Failed for command: {command}"
+        assert self.parser.validate_intent_structure(intent) is True
+    
+    def test_batch_validation_matches_single(self):
+        """Verify that batch validation agrees with validating one intent at a time."""
+        intents = self.parser.parse_intent_batch(_VALID_COMMANDS)
+        results = self.parser.validate_intent_structures(intents)
+        
+        assert results == [True] * len(_VALID_COMMANDS)
+        assert results == [self.parser.validate_intent_structure(intent) for intent in intents]
     
     # Requirement 4: Returns False for invalid intents
     def test_returns_false_for_invalid_intents(self):
         """Verify that method returns False for invalid intents."""
         # None intent
         assert self.parser.validate_intent_structure(None) is False
+        
+        # None intents are rejected in a batch too, without affecting the others
+        valid_intent = self.parser.parse_intent("Analyze AQI")
+        assert self.parser.validate_intent_structures([None, valid_intent]) == [False, True]
     
     # Additional validation: Confidence score
     def test_validates_confidence_score(self):
@@ -158,24 +172,20 @@ class TestTask22Verification:
         assert intent.user_command == original_command
     
     # Integration test: Full pipeline
-    def test_full_validation_pipeline(self):
+    @pytest.mark.parametrize("command,should_be_valid,expected_action", [
+        ("Generate report for Delhi", True, "generate_report"),
+        ("Analyze AQI", True, "analyze_aqi"),
+        ("Send alert", True, "send_alert"),
+        ("", True, "error"),
+        ("random gibberish", True, "unknown"),
+    ])
+    def test_full_validation_pipeline(self, command, should_be_valid, expected_action):
         """Test the full validation pipeline with various commands."""
-        test_cases = [
-            ("Generate report for Delhi", True, "generate_report"),
-            ("Analyze AQI", True, "analyze_aqi"),
-            ("Send alert", True, "send_alert"),
-            ("", True, "error"),
-            ("random gibberish", True, "unknown"),
-        ]
+        intent = self.parser.parse_intent(command)
+        is_valid = self.parser.validate_intent_structure(intent)
         
-        for command, should_be_valid, expected_action in test_cases:
-            intent = self.parser.parse_intent(command)
-            is_valid = self.parser.validate_intent_structure(intent)
-            
-            assert is_valid == should_be_valid, \
-                f"Validation failed for command: '{command}'"
-            assert intent.action == expected_action, \
-                f"Action mismatch for command: '{command}'"
+        assert is_valid == should_be_valid
+        assert intent.action == expected_action
 
 
 if __name__ == "__main__":